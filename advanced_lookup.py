@@ -13,64 +13,69 @@ Do not use for illegal activities or privacy violations.
 import os
 import sys
 import json
+import atexit
 import time
 import random
 import hashlib
 import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict, replace
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-try:
-    import requests
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
-except ImportError:
+from lazy_imports import LazyModule, module_available
+
+# Heavy libraries are imported on first use to keep CLI startup fast
+if not module_available('requests'):
     print("❌ Error: requests library not found")
     print("📦 Install with: pip install requests")
     sys.exit(1)
 
+requests = LazyModule('requests')
+
 try:
     from config import (
         DEVELOPER_INFO, APP_SETTINGS, COUNTRY_CODES, 
         USER_AGENTS, API_CONFIG, VALIDATION_RULES,
-        ERROR_MESSAGES, SUCCESS_MESSAGES, DISCLAIMERS
+        ERROR_MESSAGES, SUCCESS_MESSAGES, DISCLAIMERS,
+        ANALYSIS_ENGINES, ANALYSIS_SETTINGS, DATABASE_SETTINGS, OUTPUT_SETTINGS
     )
 except ImportError:
     print("❌ Error: config.py not found")
     print("💡 Make sure config.py is in the same directory")
     sys.exit(1)
 
+from result_cache import LRUResultCache
+from sqlite_cache import SQLiteResultCache
+from result_store import CompactResultStore
+from history_index import HistoryIndex
+from columnar_export import COLUMNAR_FORMATS, write_results
+from csv_export import COMPRESSION_SUFFIXES, compression_for, open_text_output, write_results_csv
+from json_lines import write_lines
+from metrics import StageClock, StageTimings
+from metadata_cache import PrefixMetadataCache
+
 # Optional imports for enhanced functionality
-try:
-    import phonenumbers
-    from phonenumbers import geocoder, carrier, timezone
-    PHONENUMBERS_AVAILABLE = True
-except ImportError:
-    PHONENUMBERS_AVAILABLE = False
+PHONENUMBERS_AVAILABLE = module_available('phonenumbers')
+phonenumbers = LazyModule('phonenumbers')
+geocoder = LazyModule('phonenumbers.geocoder')
+carrier = LazyModule('phonenumbers.carrier')
+timezone = LazyModule('phonenumbers.timezone')
 
-try:
-    from fake_useragent import UserAgent
-    FAKE_USERAGENT_AVAILABLE = True
-except ImportError:
-    FAKE_USERAGENT_AVAILABLE = False
+FAKE_USERAGENT_AVAILABLE = module_available('fake_useragent')
+fake_useragent = LazyModule('fake_useragent')
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+RICH_AVAILABLE = module_available('rich')
+rich_console = LazyModule('rich.console')
+rich_table = LazyModule('rich.table')
+rich_panel = LazyModule('rich.panel')
+rich_progress = LazyModule('rich.progress')
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.text import Text
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# Immutable tables for the educational simulation (shared read-only across threads)
+SIMULATED_CARRIERS = ("Educational Carrier A", "Educational Carrier B", "Educational Carrier C")
+SIMULATED_REGIONS = ("Educational Region 1", "Educational Region 2", "Educational Region 3")
+SIMULATED_LINE_TYPES = ("Mobile", "Fixed Line", "VoIP")
+SIMULATION_COUNTRY_CODES = tuple(COUNTRY_CODES)
 
 @dataclass
 class PhoneAnalysisResult:
@@ -90,19 +95,126 @@ class PhoneAnalysisResult:
     additional_info: Dict
     educational_note: str
 
+def _copy_data(value):
+    """Copy nested dicts and lists of plain values (much cheaper than copy.deepcopy)"""
+    if isinstance(value, dict):
+        return {key: _copy_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_data(item) for item in value]
+    return value
+
+def _detached_copy(result: PhoneAnalysisResult, **changes) -> PhoneAnalysisResult:
+    """Copy a result without sharing its mutable timezone list or additional_info"""
+    return replace(result, timezone=list(result.timezone),
+                   additional_info=_copy_data(result.additional_info), **changes)
+
 class AdvancedPhoneLookup:
     """Advanced Phone Lookup Tool with enhanced analysis capabilities"""
     
-    def __init__(self):
-        self.console = Console() if RICH_AVAILABLE else None
-        self.session = self._create_session()
+    def __init__(self, engine: str = None, workers: int = None):
+        self.engine = engine or ANALYSIS_SETTINGS['engine']
+        if self.engine not in ANALYSIS_ENGINES:
+            raise ValueError(f"Unknown analysis engine: {self.engine}")
+        self.workers = workers or ANALYSIS_SETTINGS['workers']
+        self.cache = self._create_cache()
+        self.db_cache = self._create_db_cache()
+        self.metadata_cache = self._create_metadata_cache()
+        self._console = None
+        self._session = None
         self.results_dir = "results"
         self.logs_dir = "logs"
+        self._history = None
+        # Cleaned input -> E.164 cache key, so repeated spellings skip the parse
+        self._e164_keys = {}
+        self.stage_timings = StageTimings(ANALYSIS_SETTINGS['stage_timing'])
         self._ensure_directories()
         self._setup_logging()
         
-    def _create_session(self) -> requests.Session:
+    def _create_cache(self) -> Optional[LRUResultCache]:
+        """Create the in-memory result cache if caching is enabled"""
+        if not DATABASE_SETTINGS.get('cache_results'):
+            return None
+        return LRUResultCache(
+            max_size=DATABASE_SETTINGS.get('cache_size', 10000),
+            ttl=DATABASE_SETTINGS.get('cache_duration', 3600)
+        )
+    
+    def _create_metadata_cache(self) -> Optional[PrefixMetadataCache]:
+        """Create the per-prefix geocoder/carrier/timezone memo unless disabled"""
+        if not ANALYSIS_SETTINGS.get('metadata_cache_size'):
+            return None
+        return PrefixMetadataCache(max_size=ANALYSIS_SETTINGS['metadata_cache_size'])
+    
+    def _create_db_cache(self) -> Optional[SQLiteResultCache]:
+        """Open the persistent SQLite result cache if the database is enabled"""
+        if not DATABASE_SETTINGS.get('use_database') or DATABASE_SETTINGS.get('db_type') != 'sqlite':
+            return None
+        db_cache = SQLiteResultCache(
+            DATABASE_SETTINGS['db_file'],
+            ttl=DATABASE_SETTINGS.get('cache_duration', 3600),
+            batch_size=DATABASE_SETTINGS.get('batch_size', 500)
+        )
+        atexit.register(db_cache.flush)
+        return db_cache
+    
+    @property
+    def history(self) -> HistoryIndex:
+        """Index of saved result files (opened on first use)"""
+        if self._history is None:
+            self._history = HistoryIndex(os.path.join(self.results_dir, 'history_index.db'))
+        return self._history
+    
+    def index_result_file(self, filepath: str, total: int, countries: Iterable[str] = (),
+                          appended: bool = False):
+        """Add a file written into results_dir to the history index
+        
+        appended adds total and countries to the file's existing entry
+        (daily logs). Files outside results_dir, and formats the history
+        download does not serve, are skipped.
+        """
+        directory, filename = os.path.split(os.path.abspath(filepath))
+        if directory != os.path.abspath(self.results_dir) or not filename.endswith(('.json', '.jsonl')):
+            return
+        if appended:
+            self.history.append(filename, time.time(), total, countries)
+        else:
+            self.history.add(filename, time.time(), total, countries)
+    
+    def flush_caches(self):
+        """Write any buffered persistent cache entries to disk"""
+        if self.db_cache is not None:
+            self.db_cache.flush()
+    
+    def cache_stats(self) -> Dict:
+        """Return result cache counters (hits, misses, evictions, ...)"""
+        stats = {'enabled': self.cache is not None}
+        if self.cache is not None:
+            stats.update(self.cache.stats())
+        if self.db_cache is not None:
+            stats['sqlite'] = self.db_cache.stats()
+        if self.metadata_cache is not None:
+            stats['metadata'] = self.metadata_cache.stats()
+        return stats
+    
+    @property
+    def console(self):
+        """Rich console (created on first use), or None without rich"""
+        if self._console is None and RICH_AVAILABLE:
+            self._console = rich_console.Console()
+        return self._console
+    
+    @property
+    def session(self) -> 'requests.Session':
+        """HTTP session (created on first use)"""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self) -> 'requests.Session':
         """Create a robust HTTP session with retry strategy"""
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         session = requests.Session()
         
         # Retry strategy
@@ -133,12 +245,12 @@ class AdvancedPhoneLookup:
         """Get a random user agent"""
         if FAKE_USERAGENT_AVAILABLE:
             try:
-                ua = UserAgent()
+                ua = fake_useragent.UserAgent()
                 return ua.random
             except:
                 pass
         
-        return random.choice(USER_AGENTS['browsers'])
+        return random.choice(USER_AGENTS)
     
     def _ensure_directories(self):
         """Ensure required directories exist"""
@@ -146,26 +258,48 @@ class AdvancedPhoneLookup:
             os.makedirs(directory, exist_ok=True)
     
     def _setup_logging(self):
-        """Setup logging configuration"""
+        """Setup logging configuration
+        
+        Records are handed to a queue and written by a single listener
+        thread, so analysis threads never wait on file/console handler locks.
+        """
         import logging
+        from logging.handlers import QueueHandler, QueueListener
+        from queue import SimpleQueue
+        
+        self.logger = logging.getLogger(__name__)
+        root = logging.getLogger()
+        if root.handlers:
+            return  # already configured (like logging.basicConfig, first setup wins)
         
         log_file = os.path.join(self.logs_dir, f"advanced_lookup_{datetime.now().strftime('%Y%m%d')}.log")
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file, encoding='utf-8'), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        log_queue = SimpleQueue()
+        listener = QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
         
-        self.logger = logging.getLogger(__name__)
+        queue_handler = QueueHandler(log_queue)
+        root.setLevel(logging.INFO)
+        root.addHandler(queue_handler)
+        
+        def log_directly():
+            # A forked pool worker has no listener thread; write through the handlers
+            root.removeHandler(queue_handler)
+            for handler in handlers:
+                root.addHandler(handler)
+        
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=log_directly)
     
     def _print_banner(self):
         """Print application banner"""
         if RICH_AVAILABLE:
-            banner = Panel.fit(
+            banner = rich_panel.Panel.fit(
                 "[bold blue]📱 Advanced Phone Lookup Tool 📱[/bold blue]\n"
                 f"[green]Developer:[/green] {DEVELOPER_INFO['name']}\n"
                 f"[green]Email:[/green] {DEVELOPER_INFO['email']}\n\n"
@@ -190,34 +324,60 @@ class AdvancedPhoneLookup:
             return False, "", "Phone number cannot be empty"
         
         # Basic validation
-        if len(cleaned.replace('+', '')) < VALIDATION_RULES['min_length']:
-            return False, "", f"Phone number too short (minimum {VALIDATION_RULES['min_length']} digits)"
+        if len(cleaned.replace('+', '')) < VALIDATION_RULES['min_phone_length']:
+            return False, "", f"Phone number too short (minimum {VALIDATION_RULES['min_phone_length']} digits)"
         
-        if len(cleaned.replace('+', '')) > VALIDATION_RULES['max_length']:
-            return False, "", f"Phone number too long (maximum {VALIDATION_RULES['max_length']} digits)"
+        if len(cleaned.replace('+', '')) > VALIDATION_RULES['max_phone_length']:
+            return False, "", f"Phone number too long (maximum {VALIDATION_RULES['max_phone_length']} digits)"
         
-        # Add + if not present
-        if not cleaned.startswith('+'):
+        # Add + if not present (a leading 00 is the international call prefix)
+        if cleaned.startswith('00'):
+            cleaned = '+' + cleaned[2:]
+        elif not cleaned.startswith('+'):
             cleaned = '+' + cleaned
         
         return True, cleaned, "Valid format"
     
-    def analyze_with_phonenumbers(self, phone_number: str) -> Dict:
-        """Analyze phone number using phonenumbers library"""
+    def _cache_number(self, formatted_number: str) -> str:
+        """E.164 form of a validated number, used in cache keys
+        
+        Falls back to the cleaned input when it does not parse.
+        """
+        e164 = self._e164_keys.get(formatted_number)
+        if e164 is not None:
+            return e164
+        
+        e164 = formatted_number
+        if PHONENUMBERS_AVAILABLE:
+            try:
+                parsed = phonenumbers.parse(formatted_number, None)
+                e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+            except phonenumbers.NumberParseException:
+                pass
+        if len(self._e164_keys) >= DATABASE_SETTINGS.get('cache_size', 10000):
+            self._e164_keys.clear()
+        self._e164_keys[formatted_number] = e164
+        return e164
+    
+    def analyze_with_phonenumbers(self, phone_number: str, clock: StageClock = None) -> Dict:
+        """Analyze phone number using phonenumbers library
+        
+        Geocoder, carrier and timezone answers come from self.metadata_cache
+        when enabled. clock, when given, records the parse, validity,
+        lookup and formatting stages.
+        """
         if not PHONENUMBERS_AVAILABLE:
             return {"error": "phonenumbers library not available"}
         
         try:
             # Parse the number
             parsed = phonenumbers.parse(phone_number, None)
-            
-            # Get information
-            country_code = f"+{parsed.country_code}"
-            country_name = geocoder.description_for_number(parsed, "en")
-            carrier_name = carrier.name_for_number(parsed, "en")
-            timezones = timezone.time_zones_for_number(parsed)
+            if clock:
+                clock.lap('parse')
             
             # Validation
+            country_code = f"+{parsed.country_code}"
+            region_code = phonenumbers.region_code_for_number(parsed)
             is_valid = phonenumbers.is_valid_number(parsed)
             is_possible = phonenumbers.is_possible_number(parsed)
             
@@ -239,16 +399,37 @@ class AdvancedPhoneLookup:
             }
             
             line_type = type_mapping.get(number_type, "Unknown")
+            if clock:
+                clock.lap('validity')
+            
+            # Get information
+            if self.metadata_cache is not None:
+                country_name, carrier_name, timezones = self.metadata_cache.lookup(parsed, number_type)
+                if clock:
+                    clock.lap('metadata_cache')
+            else:
+                country_name = geocoder.description_for_number(parsed, "en")
+                if clock:
+                    clock.lap('geocoder')
+                carrier_name = carrier.name_for_number(parsed, "en")
+                if clock:
+                    clock.lap('carrier')
+                timezones = timezone.time_zones_for_number(parsed)
+                if clock:
+                    clock.lap('timezone')
             
             # Format number
             formatted_international = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
             formatted_national = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL)
             formatted_e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+            if clock:
+                clock.lap('formatting')
             
             return {
                 "success": True,
                 "country_code": country_code,
                 "country_name": country_name or "Unknown",
+                "region_code": region_code or "Unknown",
                 "carrier": carrier_name or "Unknown",
                 "timezones": list(timezones),
                 "line_type": line_type,
@@ -270,33 +451,33 @@ class AdvancedPhoneLookup:
             return {"error": f"Analysis failed: {str(e)}"}
     
     def educational_lookup_simulation(self, phone_number: str) -> Dict:
-        """Simulate educational lookup with realistic data patterns"""
+        """Simulate educational lookup with realistic data patterns
+        
+        Reentrant: draws from a per-call RNG seeded from the number, so
+        concurrent calls never touch the global random state.
+        """
         # Generate deterministic but realistic-looking data based on phone number
         seed = int(hashlib.md5(phone_number.encode()).hexdigest()[:8], 16)
-        random.seed(seed)
+        rng = random.Random(seed)
         
         # Simulate processing time
-        time.sleep(random.uniform(1, 3))
+        time.sleep(rng.uniform(1, 3))
         
         # Extract country code
         country_code = "+1"  # Default
-        for code, info in COUNTRY_CODES.items():
+        for code in SIMULATION_COUNTRY_CODES:
             if phone_number.startswith(code):
                 country_code = code
                 break
         
-        # Generate educational data
-        carriers = ["Educational Carrier A", "Educational Carrier B", "Educational Carrier C"]
-        regions = ["Educational Region 1", "Educational Region 2", "Educational Region 3"]
-        
         return {
             "phone_number": phone_number,
             "country_code": country_code,
-            "country_name": COUNTRY_CODES.get(country_code, {}).get('name', 'Unknown'),
-            "region": random.choice(regions),
-            "carrier": random.choice(carriers),
-            "line_type": random.choice(["Mobile", "Fixed Line", "VoIP"]),
-            "confidence": random.uniform(0.7, 0.95),
+            "country_name": COUNTRY_CODES.get(country_code, {}).get('country', 'Unknown'),
+            "region": rng.choice(SIMULATED_REGIONS),
+            "carrier": rng.choice(SIMULATED_CARRIERS),
+            "line_type": rng.choice(SIMULATED_LINE_TYPES),
+            "confidence": rng.uniform(0.7, 0.95),
             "educational_note": "This is simulated data for educational purposes only",
             "timestamp": datetime.now().isoformat(),
             "additional_info": {
@@ -306,40 +487,135 @@ class AdvancedPhoneLookup:
             }
         }
     
-    def comprehensive_analysis(self, phone_number: str) -> PhoneAnalysisResult:
-        """Perform comprehensive phone number analysis"""
-        self.logger.info(f"Starting comprehensive analysis for: {phone_number}")
+    def comprehensive_analysis(self, phone_number: str, engine: str = None) -> PhoneAnalysisResult:
+        """Perform comprehensive phone number analysis
+        
+        With ANALYSIS_SETTINGS['stage_timing'] on, each stage's duration is
+        recorded in self.stage_timings; otherwise clock stays None.
+        """
+        engine = engine or self.engine
+        simulate = engine != 'fast'
+        clock = self.stage_timings.start()
+        
+        if simulate:
+            self.logger.info(f"Starting comprehensive analysis for: {phone_number}")
         
         # Validate phone number
         is_valid_format, formatted_number, validation_msg = self.validate_phone_number(phone_number)
+        if clock:
+            clock.lap('validation')
         
         if not is_valid_format:
-            return PhoneAnalysisResult(
-                phone_number=phone_number,
-                formatted_number="",
-                country_code="",
-                country_name="",
-                region="",
-                carrier="",
-                line_type="",
-                timezone=[],
-                is_valid=False,
-                is_possible=False,
-                analysis_timestamp=datetime.now().isoformat(),
-                confidence_score=0.0,
-                additional_info={"error": validation_msg},
-                educational_note=DISCLAIMERS['educational_purpose']
-            )
+            result = self._invalid_result(phone_number, validation_msg)
+            if clock:
+                clock.lap('result_construction')
+                clock.finish()
+            return result
+        
+        # Repeated numbers are served from the cache, keyed on the E.164 form so
+        # different spellings of one number share an entry
+        caching = self.cache is not None or self.db_cache is not None
+        e164 = self._cache_number(formatted_number) if caching else formatted_number
+        cache_key = (engine, e164)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                # Callers get their own copy, so changing it cannot corrupt the cache
+                result = _detached_copy(cached, phone_number=phone_number,
+                                        analysis_timestamp=datetime.now().isoformat())
+                if clock:
+                    clock.lap('cache_lookup')
+                    clock.finish()
+                return result
         
+        # Then the persistent cache shared with earlier runs and other processes
+        db_key = f"{engine}:{e164}"
+        if self.db_cache is not None:
+            record = self.db_cache.get(db_key)
+            if record is not None:
+                result = self._result_from_record(phone_number, record)
+                if self.cache is not None:
+                    self.cache.put(cache_key, _detached_copy(result))
+                if clock:
+                    clock.lap('cache_lookup')
+                    clock.finish()
+                return result
+        if clock:
+            clock.lap('cache_lookup')
+        
+        if simulate:
+            result = self._simulation_analysis(phone_number, formatted_number, clock)
+            self.logger.info(f"Analysis completed for: {phone_number}")
+        else:
+            result = self._fast_analysis(phone_number, formatted_number, clock)
+        if clock:
+            clock.lap('result_construction')
+        
+        if "error" not in result.additional_info:
+            if self.cache is not None:
+                self.cache.put(cache_key, _detached_copy(result))
+            if self.db_cache is not None:
+                self.db_cache.put(db_key, self._record_from_result(result))
+        if clock:
+            clock.lap('cache_store')
+            clock.finish()
+        
+        return result
+    
+    def _record_from_result(self, result: PhoneAnalysisResult) -> Dict:
+        """Reduce a result to the fields kept in the persistent cache"""
+        phonenumbers_data = result.additional_info.get("phonenumbers_data", {})
+        return {
+            'e164': phonenumbers_data.get("formatted", {}).get("e164", result.formatted_number),
+            'formatted_number': result.formatted_number,
+            'country_code': result.country_code,
+            'country_name': result.country_name,
+            'region': result.region,
+            'carrier': result.carrier,
+            'line_type': result.line_type,
+            'timezones': list(result.timezone),
+            'is_valid': result.is_valid,
+            'is_possible': result.is_possible,
+            'confidence_score': result.confidence_score
+        }
+    
+    def _result_from_record(self, phone_number: str, record: Dict) -> PhoneAnalysisResult:
+        """Rebuild a result from a persistent cache record"""
+        return PhoneAnalysisResult(
+            phone_number=phone_number,
+            formatted_number=record['formatted_number'],
+            country_code=record['country_code'],
+            country_name=record['country_name'],
+            region=record['region'],
+            carrier=record['carrier'],
+            line_type=record['line_type'],
+            timezone=record['timezones'],
+            is_valid=record['is_valid'],
+            is_possible=record['is_possible'],
+            analysis_timestamp=datetime.now().isoformat(),
+            confidence_score=record['confidence_score'],
+            additional_info={
+                # Same layout as a fresh analysis, so exports find the E.164 form
+                "phonenumbers_data": {"formatted": {"e164": record['e164']}},
+                "source": "sqlite_cache"
+            },
+            educational_note=DISCLAIMERS['educational_use']
+        )
+    
+    def _simulation_analysis(self, phone_number: str, formatted_number: str,
+                             clock: StageClock = None) -> PhoneAnalysisResult:
+        """Combine phonenumbers data with the educational simulation"""
         # Perform phonenumbers analysis if available
-        phonenumbers_result = self.analyze_with_phonenumbers(formatted_number)
+        phonenumbers_result = self.analyze_with_phonenumbers(formatted_number, clock)
         
         # Perform educational simulation
         educational_result = self.educational_lookup_simulation(formatted_number)
+        if clock:
+            clock.lap('simulation')
         
         # Combine results
         if phonenumbers_result.get("success"):
-            result = PhoneAnalysisResult(
+            return PhoneAnalysisResult(
                 phone_number=phone_number,
                 formatted_number=phonenumbers_result["formatted"]["international"],
                 country_code=phonenumbers_result["country_code"],
@@ -356,125 +632,265 @@ class AdvancedPhoneLookup:
                     "phonenumbers_data": phonenumbers_result,
                     "educational_data": educational_result
                 },
-                educational_note=DISCLAIMERS['educational_purpose']
+                educational_note=DISCLAIMERS['educational_use']
             )
+        
+        return PhoneAnalysisResult(
+            phone_number=phone_number,
+            formatted_number=formatted_number,
+            country_code=educational_result["country_code"],
+            country_name=educational_result["country_name"],
+            region=educational_result["region"],
+            carrier=educational_result["carrier"],
+            line_type=educational_result["line_type"],
+            timezone=[],
+            is_valid=True,
+            is_possible=True,
+            analysis_timestamp=datetime.now().isoformat(),
+            confidence_score=educational_result["confidence"],
+            additional_info={"educational_data": educational_result},
+            educational_note=DISCLAIMERS['educational_use']
+        )
+    
+    def fast_analysis(self, phone_number: str) -> PhoneAnalysisResult:
+        """Analyze using real phonenumbers metadata only (no simulation, no delays)"""
+        return self.comprehensive_analysis(phone_number, 'fast')
+    
+    def _fast_analysis(self, phone_number: str, formatted_number: str,
+                       clock: StageClock = None) -> PhoneAnalysisResult:
+        """Build a result from phonenumbers metadata alone"""
+        phonenumbers_result = self.analyze_with_phonenumbers(formatted_number, clock)
+        
+        if not phonenumbers_result.get("success"):
+            return self._invalid_result(phone_number, phonenumbers_result.get("error", "Analysis failed"),
+                                        formatted_number=formatted_number)
+        
+        # Confidence reflects the real validation outcome instead of a simulated score
+        if phonenumbers_result["is_valid"]:
+            confidence = 1.0
+        elif phonenumbers_result["is_possible"]:
+            confidence = 0.5
         else:
-            result = PhoneAnalysisResult(
-                phone_number=phone_number,
-                formatted_number=formatted_number,
-                country_code=educational_result["country_code"],
-                country_name=educational_result["country_name"],
-                region=educational_result["region"],
-                carrier=educational_result["carrier"],
-                line_type=educational_result["line_type"],
-                timezone=[],
-                is_valid=True,
-                is_possible=True,
-                analysis_timestamp=datetime.now().isoformat(),
-                confidence_score=educational_result["confidence"],
-                additional_info={"educational_data": educational_result},
-                educational_note=DISCLAIMERS['educational_purpose']
-            )
+            confidence = 0.0
         
-        self.logger.info(f"Analysis completed for: {phone_number}")
-        return result
+        return PhoneAnalysisResult(
+            phone_number=phone_number,
+            formatted_number=phonenumbers_result["formatted"]["international"],
+            country_code=phonenumbers_result["country_code"],
+            country_name=phonenumbers_result["country_name"],
+            region=phonenumbers_result["region_code"],
+            carrier=phonenumbers_result["carrier"],
+            line_type=phonenumbers_result["line_type"],
+            timezone=phonenumbers_result["timezones"],
+            is_valid=phonenumbers_result["is_valid"],
+            is_possible=phonenumbers_result["is_possible"],
+            analysis_timestamp=datetime.now().isoformat(),
+            confidence_score=confidence,
+            additional_info={"phonenumbers_data": phonenumbers_result},
+            educational_note=DISCLAIMERS['educational_use']
+        )
     
-    def batch_analysis(self, phone_numbers: List[str]) -> List[PhoneAnalysisResult]:
-        """Perform batch analysis on multiple phone numbers"""
-        results = []
+    def _invalid_result(self, phone_number: str, error: str, formatted_number: str = "") -> PhoneAnalysisResult:
+        """Build the result returned for numbers that could not be analyzed"""
+        return PhoneAnalysisResult(
+            phone_number=phone_number,
+            formatted_number=formatted_number,
+            country_code="",
+            country_name="",
+            region="",
+            carrier="",
+            line_type="",
+            timezone=[],
+            is_valid=False,
+            is_possible=False,
+            analysis_timestamp=datetime.now().isoformat(),
+            confidence_score=0.0,
+            additional_info={"error": error},
+            educational_note=DISCLAIMERS['educational_use']
+        )
+    
+    def batch_analysis(self, phone_numbers: List[str], engine: str = None,
+                       compact: bool = None) -> List[PhoneAnalysisResult]:
+        """Perform batch analysis on multiple phone numbers
         
-        if RICH_AVAILABLE:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
+        With compact=True results are collected in a CompactResultStore, which
+        behaves like a list of results but keeps only interned summary columns.
+        """
+        if compact is None:
+            compact = ANALYSIS_SETTINGS['compact_results']
+        results = CompactResultStore(PhoneAnalysisResult) if compact else []
+        for result in self.iter_batch_analysis(phone_numbers, engine):
+            results.append(result)
+        return results
+    
+    def iter_batch_analysis(self, phone_numbers: List[str], engine: str = None) -> Iterator[PhoneAnalysisResult]:
+        """Yield batch analysis results as they complete (input order only for the fast engine)"""
+        engine = engine or self.engine
+        
+        # The fast engine is CPU-bound, so spread it across processes when asked to
+        if engine == 'fast' and self.workers > 1:
+            yield from self._parallel_fast_batch(phone_numbers)
+        elif RICH_AVAILABLE:
+            with rich_progress.Progress(
+                rich_progress.SpinnerColumn(),
+                rich_progress.TextColumn("[progress.description]{task.description}"),
                 console=self.console
             ) as progress:
                 task = progress.add_task("Analyzing phone numbers...", total=len(phone_numbers))
                 
                 with ThreadPoolExecutor(max_workers=3) as executor:
-                    future_to_number = {executor.submit(self.comprehensive_analysis, num): num for num in phone_numbers}
+                    future_to_number = {executor.submit(self.comprehensive_analysis, num, engine): num for num in phone_numbers}
                     
                     for future in as_completed(future_to_number):
                         number = future_to_number[future]
                         try:
                             result = future.result()
-                            results.append(result)
-                            progress.update(task, advance=1)
                         except Exception as e:
                             self.logger.error(f"Error analyzing {number}: {str(e)}")
                             progress.update(task, advance=1)
+                            continue
+                        progress.update(task, advance=1)
+                        yield result
         else:
             print(f"\n🔍 Analyzing {len(phone_numbers)} phone numbers...")
             for i, number in enumerate(phone_numbers, 1):
                 print(f"Progress: {i}/{len(phone_numbers)} - {number}")
                 try:
-                    result = self.comprehensive_analysis(number)
-                    results.append(result)
+                    result = self.comprehensive_analysis(number, engine)
                 except Exception as e:
                     self.logger.error(f"Error analyzing {number}: {str(e)}")
+                    continue
+                yield result
         
-        return results
+        self.flush_caches()
+        self.stage_timings.log_summary(self.logger)
+    
+    def batch_analysis_and_save(self, phone_numbers: List[str], engine: str = None,
+                                compact: bool = None) -> Tuple[List[PhoneAnalysisResult], str]:
+        """Batch-analyze and save, returning the results and the saved file path
+        
+        In JSON Lines mode each result is appended to the file as soon as it
+        completes; the JSON document is written once the batch is done.
+        """
+        if compact is None:
+            compact = ANALYSIS_SETTINGS['compact_results']
+        results = CompactResultStore(PhoneAnalysisResult) if compact else []
+        
+        def completed():
+            for result in self.iter_batch_analysis(phone_numbers, engine):
+                results.append(result)
+                yield result
+        
+        if OUTPUT_SETTINGS['output_format'] == 'jsonl':
+            filepath = self.save_results(completed())
+        else:
+            for _ in completed():
+                pass
+            filepath = self.save_results(results)
+        return results, filepath
+    
+    def _parallel_fast_batch(self, phone_numbers: List[str]) -> Iterator[PhoneAnalysisResult]:
+        """Fast-engine batch analysis on a process pool, results in input order"""
+        from batch_engine import chunked, parallel_map_chunks
+        
+        chunk_size = max(1, min(ANALYSIS_SETTINGS['chunk_size'], len(phone_numbers) // (self.workers * 4) or 1))
+        chunks = chunked(phone_numbers, chunk_size)
+        
+        if RICH_AVAILABLE:
+            with rich_progress.Progress(
+                rich_progress.SpinnerColumn(),
+                rich_progress.TextColumn("[progress.description]{task.description}"),
+                console=self.console
+            ) as progress:
+                task = progress.add_task(f"Analyzing phone numbers on {self.workers} workers...", total=len(phone_numbers))
+                for chunk_results in parallel_map_chunks(_fast_analysis_chunk, chunks, self.workers):
+                    yield from chunk_results
+                    progress.update(task, advance=len(chunk_results))
+        else:
+            print(f"\n🔍 Analyzing {len(phone_numbers)} phone numbers on {self.workers} workers...")
+            done = 0
+            for chunk_results in parallel_map_chunks(_fast_analysis_chunk, chunks, self.workers):
+                yield from chunk_results
+                done += len(chunk_results)
+                print(f"Progress: {done}/{len(phone_numbers)}")
     
-    def save_results(self, results: List[PhoneAnalysisResult], filename: str = None) -> str:
-        """Save analysis results to file"""
+    def columnar_batch_analysis(self, phone_numbers: Iterable[str], chunk_size: int = None) -> Dict:
+        """Analyze many numbers with the columnar batch engine (fast metadata only)
+        
+        Returns a dict of column arrays: phone_number, e164, country_code, region,
+        type, is_valid and timezones, one entry per input number in input order.
+        """
+        from batch_engine import BatchAnalysisEngine
+        
+        return BatchAnalysisEngine(chunk_size, self.workers, self.stage_timings).analyze(phone_numbers)
+    
+    def save_results(self, results: Iterable[PhoneAnalysisResult], filename: str = None) -> str:
+        """Save analysis results to file
+        
+        Writes one indented JSON document, or compact JSON Lines when
+        OUTPUT_SETTINGS['output_format'] is 'jsonl' (or filename ends in
+        .jsonl). JSON Lines records are written as results are iterated.
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"advanced_analysis_{timestamp}.json"
+            extension = 'jsonl' if OUTPUT_SETTINGS['output_format'] == 'jsonl' else 'json'
+            filename = f"advanced_analysis_{timestamp}.{extension}"
         
         filepath = os.path.join(self.results_dir, filename)
         
-        # Convert results to dict format
+        if filename.endswith('.jsonl'):
+            countries = set()
+            
+            def records():
+                for result in results:
+                    countries.add(result.country_code)
+                    yield asdict(result)
+            
+            with open(filepath, 'w', encoding='utf-8') as f:
+                total = write_lines(f, records())
+            
+            self.history.add(filename, time.time(), total, countries)
+            self.logger.info(f"Results saved to: {filepath}")
+            return filepath
+        
+        # Convert results to dict format (results may be any iterable)
+        records = [asdict(result) for result in results]
         results_data = {
             "analysis_info": {
-                "tool_name": APP_SETTINGS['name'],
-                "version": APP_SETTINGS['version'],
+                "tool_name": APP_SETTINGS['app_name'],
+                "version": DEVELOPER_INFO['version'],
                 "developer": DEVELOPER_INFO,
                 "timestamp": datetime.now().isoformat(),
-                "total_numbers": len(results),
-                "educational_note": DISCLAIMERS['educational_purpose']
+                "total_numbers": len(records),
+                "educational_note": DISCLAIMERS['educational_use']
             },
-            "results": [asdict(result) for result in results]
+            "results": records
         }
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(results_data, f, indent=2, ensure_ascii=False)
         
+        self.history.add(filename, time.time(), len(results_data["results"]),
+                         (result["country_code"] for result in results_data["results"]))
         self.logger.info(f"Results saved to: {filepath}")
         return filepath
     
-    def export_to_csv(self, results: List[PhoneAnalysisResult], filename: str = None) -> str:
-        """Export results to CSV format"""
-        if not PANDAS_AVAILABLE:
-            raise ImportError("pandas library required for CSV export")
+    def export_to_csv(self, results: Iterable[PhoneAnalysisResult], filename: str = None,
+                      compression: str = None) -> str:
+        """Export results to CSV format
         
+        Rows are streamed to disk as results are iterated. compression is
+        'gzip' or 'zstd'; by default it is inferred from a .gz/.zst filename.
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"advanced_analysis_{timestamp}.csv"
+            suffix = COMPRESSION_SUFFIXES.get(compression, '')
+            filename = f"advanced_analysis_{timestamp}.csv{suffix}"
         
         filepath = os.path.join(self.results_dir, filename)
         
-        # Convert to DataFrame
-        data = []
-        for result in results:
-            row = {
-                'Phone Number': result.phone_number,
-                'Formatted Number': result.formatted_number,
-                'Country Code': result.country_code,
-                'Country Name': result.country_name,
-                'Region': result.region,
-                'Carrier': result.carrier,
-                'Line Type': result.line_type,
-                'Timezone': ', '.join(result.timezone),
-                'Is Valid': result.is_valid,
-                'Is Possible': result.is_possible,
-                'Confidence Score': result.confidence_score,
-                'Analysis Timestamp': result.analysis_timestamp,
-                'Educational Note': result.educational_note
-            }
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        with open_text_output(filepath, compression or compression_for(filename)) as f:
+            write_results_csv(f, results)
         
         self.logger.info(f"CSV exported to: {filepath}")
         return filepath
@@ -490,7 +906,7 @@ class AdvancedPhoneLookup:
         """Display results using rich formatting"""
         for i, result in enumerate(results, 1):
             # Create table for each result
-            table = Table(title=f"📱 Analysis Result #{i}")
+            table = rich_table.Table(title=f"📱 Analysis Result #{i}")
             table.add_column("Property", style="cyan")
             table.add_column("Value", style="green")
             
@@ -510,7 +926,7 @@ class AdvancedPhoneLookup:
             self.console.print(table)
             
             # Educational note
-            note_panel = Panel(
+            note_panel = rich_panel.Panel(
                 result.educational_note,
                 title="⚠️ Educational Note",
                 border_style="yellow"
@@ -615,12 +1031,10 @@ class AdvancedPhoneLookup:
             return
         
         print(f"\n🔍 Analyzing {len(numbers)} phone numbers...")
-        results = self.batch_analysis(numbers)
+        # In JSON Lines mode results reach the file as they complete
+        results, filepath = self.batch_analysis_and_save(numbers)
         
         self.display_results(results)
-        
-        # Save results
-        filepath = self.save_results(results)
         print(f"\n💾 Results saved to: {filepath}")
         
         # Store for potential CSV export
@@ -628,46 +1042,89 @@ class AdvancedPhoneLookup:
     
     def _file_analysis_mode(self):
         """File analysis mode"""
+        from stream_pipeline import STREAM_FORMATS
+        
         filename = input("\n📁 Enter filename (txt file with one number per line): ").strip()
+        output_format = input(f"📄 Output format ({', '.join(STREAM_FORMATS)}) [jsonl]: ").strip().lower() or 'jsonl'
+        if output_format not in STREAM_FORMATS:
+            print(f"❌ Unsupported output format: {output_format}")
+            return
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                numbers = [line.strip() for line in f if line.strip()]
+            print(f"🔍 Starting streaming analysis ({self.engine} engine)...")
+            filepath, total = self.stream_file_analysis(filename, output_format=output_format)
             
-            if not numbers:
+            if not total:
                 print("❌ No phone numbers found in file")
                 return
             
-            print(f"\n📋 Found {len(numbers)} phone numbers in file")
-            print(f"🔍 Starting batch analysis...")
-            
-            results = self.batch_analysis(numbers)
-            
-            self.display_results(results)
-            
-            # Save results
-            filepath = self.save_results(results)
-            print(f"\n💾 Results saved to: {filepath}")
-            
-            # Store for potential CSV export
-            self.last_results = results
+            print(f"\n💾 {total} results saved to: {filepath}")
+            # Results are streamed to disk and not kept in memory
+            print("💡 File results are not kept for \"Export Last Results to CSV\"; choose csv as the output format instead")
+            if self.engine == 'fast':
+                print("ℹ️ The fast engine writes batch columns only (E.164, ISO region, type, validity, time zones)")
             
         except FileNotFoundError:
             print(f"❌ File not found: {filename}")
         except Exception as e:
             print(f"❌ Error reading file: {str(e)}")
     
+    def stream_file_analysis(self, input_path: str, output_path: str = None,
+                             output_format: str = 'jsonl') -> Tuple[str, int]:
+        """Analyze a file line by line and write results incrementally
+        
+        Nothing is held in memory beyond the current chunk, so this works on
+        arbitrarily large inputs. Returns the output path and number count.
+        """
+        from stream_pipeline import run_pipeline
+        
+        if not output_path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = os.path.join(self.results_dir, f"stream_analysis_{timestamp}.{output_format}")
+        
+        def report(count: int, elapsed: float):
+            rate = count / elapsed if elapsed else 0
+            print(f"\rProgress: {count:,} numbers ({rate:,.0f}/sec)", end='', flush=True)
+        
+        countries = set()
+        total = run_pipeline(input_path, output_path, self, output_format, progress=report,
+                             countries=countries)
+        self.index_result_file(output_path, total, countries)
+        self.flush_caches()
+        self.stage_timings.log_summary(self.logger)
+        print()
+        
+        self.logger.info(f"Streamed {total} results to: {output_path}")
+        return output_path, total
+    
+    def export_columnar(self, results: Iterable[PhoneAnalysisResult], filename: str = None,
+                        output_format: str = 'parquet') -> str:
+        """Export results as typed Parquet or Arrow IPC (requires pyarrow)
+        
+        Results are written in chunks of ANALYSIS_SETTINGS['chunk_size'] rows,
+        one row group / record batch each.
+        """
+        if output_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {output_format}")
+        
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"advanced_analysis_{timestamp}.{output_format}"
+        
+        filepath = os.path.join(self.results_dir, filename)
+        
+        with open(filepath, 'wb') as f:
+            total = write_results(f, results, output_format, ANALYSIS_SETTINGS['chunk_size'])
+        
+        self.logger.info(f"{output_format.capitalize()} export of {total} results: {filepath}")
+        return filepath
+    
     def _export_csv_mode(self):
         """Export to CSV mode"""
         if not hasattr(self, 'last_results') or not self.last_results:
             print("❌ No results to export. Please run an analysis first.")
             return
         
-        if not PANDAS_AVAILABLE:
-            print("❌ pandas library required for CSV export")
-            print("📦 Install with: pip install pandas")
-            return
-        
         try:
             filepath = self.export_to_csv(self.last_results)
             print(f"\n📊 CSV exported to: {filepath}")
@@ -677,45 +1134,84 @@ class AdvancedPhoneLookup:
     def _view_history_mode(self):
         """View analysis history"""
         try:
-            files = [f for f in os.listdir(self.results_dir) if f.endswith('.json')]
+            page = self.history.query(limit=10)
             
-            if not files:
+            if not page['total']:
                 print("\n📁 No analysis history found")
                 return
             
-            print(f"\n📖 Analysis History ({len(files)} files):")
+            print(f"\n📖 Analysis History ({page['total']} files):")
             print("=" * 40)
             
-            for i, filename in enumerate(sorted(files, reverse=True)[:10], 1):
-                filepath = os.path.join(self.results_dir, filename)
-                mtime = os.path.getmtime(filepath)
-                mtime_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-                print(f"{i:2d}. {filename} ({mtime_str})")
+            for i, entry in enumerate(page['entries'], 1):
+                mtime_str = datetime.fromtimestamp(entry['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+                print(f"{i:2d}. {entry['name']} ({mtime_str})")
             
-            if len(files) > 10:
-                print(f"    ... and {len(files) - 10} more files")
+            if page['total'] > 10:
+                print(f"    ... and {page['total'] - 10} more files")
                 
         except Exception as e:
             print(f"❌ Error viewing history: {str(e)}")
 
+# Per-process tool used by process pool workers
+_worker_tool = None
+
+def _fast_analysis_chunk(chunk: List[str]) -> List[PhoneAnalysisResult]:
+    """Process pool entry point: fast-analyze one chunk of numbers"""
+    global _worker_tool
+    if _worker_tool is None:
+        _worker_tool = AdvancedPhoneLookup(engine='fast', workers=1)
+    results = [_worker_tool.fast_analysis(number) for number in chunk]
+    # Pool workers exit without running atexit hooks, so flush per chunk
+    _worker_tool.flush_caches()
+    return results
+
 def main():
     """Main function"""
+    import argparse
+    from contextlib import nullcontext
+    from profiling import add_profile_arguments, profiler_from_args
+    from stream_pipeline import STREAM_FORMATS
+    
+    parser = argparse.ArgumentParser(description='Advanced Phone Lookup Tool')
+    parser.add_argument('phone_number', nargs='?', help='Phone number to analyze (interactive mode if omitted)')
+    parser.add_argument('--engine', choices=ANALYSIS_ENGINES, default=ANALYSIS_SETTINGS['engine'],
+                        help=f"Analysis engine (default: {ANALYSIS_SETTINGS['engine']})")
+    parser.add_argument('--workers', type=int, default=ANALYSIS_SETTINGS['workers'],
+                        help='Worker processes for fast batch analysis (default: %(default)s)')
+    parser.add_argument('--file', help='Stream-analyze a file with one number per line')
+    parser.add_argument('--output', help='Output file for --file (default: results/stream_analysis_<timestamp>.<format>)')
+    parser.add_argument('--format', choices=STREAM_FORMATS, default='jsonl',
+                        help='Output format for --file (default: jsonl)')
+    parser.add_argument('--stage-timing', action='store_true', default=ANALYSIS_SETTINGS['stage_timing'],
+                        help='Record per-stage analysis timings and log a summary')
+    add_profile_arguments(parser)
+    
+    args = parser.parse_args()
+    
     try:
-        tool = AdvancedPhoneLookup()
+        ANALYSIS_SETTINGS['stage_timing'] = args.stage_timing
+        tool = AdvancedPhoneLookup(engine=args.engine, workers=args.workers)
         
-        if len(sys.argv) > 1:
-            # Command line mode
-            phone_number = sys.argv[1]
-            print(f"\n🔍 Analyzing: {phone_number}")
-            
-            result = tool.comprehensive_analysis(phone_number)
-            tool.display_results([result])
-            
-            filepath = tool.save_results([result])
-            print(f"\n💾 Results saved to: {filepath}")
-        else:
-            # Interactive mode
-            tool.interactive_mode()
+        with profiler_from_args(args) or nullcontext():
+            if args.file:
+                # Streaming file mode
+                filepath, total = tool.stream_file_analysis(args.file, args.output, args.format)
+                print(f"\n💾 {total} results saved to: {filepath}")
+            elif args.phone_number:
+                # Command line mode
+                phone_number = args.phone_number
+                print(f"\n🔍 Analyzing: {phone_number}")
+                
+                result = tool.comprehensive_analysis(phone_number)
+                tool.stage_timings.log_summary(tool.logger)
+                tool.display_results([result])
+                
+                filepath = tool.save_results([result])
+                print(f"\n💾 Results saved to: {filepath}")
+            else:
+                # Interactive mode
+                tool.interactive_mode()
             
     except KeyboardInterrupt:
         print("\n\n👋 Operation cancelled by user")
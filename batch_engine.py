@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar Batch Analysis Engine
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Analyzes large lists of phone numbers chunk by chunk and returns column
+arrays instead of one result object per number.
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from config import ANALYSIS_SETTINGS, COUNTRY_CODES
+from lazy_imports import LazyModule, module_available
+
+# phonenumbers loads its metadata on first use, not when the engine is imported
+PHONENUMBERS_AVAILABLE = module_available('phonenumbers')
+phonenumbers = LazyModule('phonenumbers')
+pn_timezone = LazyModule('phonenumbers.timezone')
+
+# Column names produced by the engine, in output order
+COLUMNS = ('phone_number', 'e164', 'country_code', 'region', 'type', 'is_valid', 'timezones')
+
+_type_labels = None
+
+def type_labels() -> Dict[int, str]:
+    """Display labels for phonenumbers.PhoneNumberType values (built on first use)"""
+    global _type_labels
+    if _type_labels is None:
+        number_type = phonenumbers.PhoneNumberType
+        _type_labels = {
+            number_type.MOBILE: "Mobile",
+            number_type.FIXED_LINE: "Fixed Line",
+            number_type.FIXED_LINE_OR_MOBILE: "Fixed Line or Mobile",
+            number_type.TOLL_FREE: "Toll Free",
+            number_type.PREMIUM_RATE: "Premium Rate",
+            number_type.SHARED_COST: "Shared Cost",
+            number_type.VOIP: "VoIP",
+            number_type.PERSONAL_NUMBER: "Personal Number",
+            number_type.PAGER: "Pager",
+            number_type.UAN: "UAN",
+            number_type.VOICEMAIL: "Voicemail",
+            number_type.UNKNOWN: "Unknown"
+        }
+    return _type_labels
+
+def empty_columns() -> Dict:
+    """Create an empty column set"""
+    return {
+        'phone_number': [],
+        'e164': [],
+        'country_code': array('H'),
+        'region': [],
+        'type': [],
+        'is_valid': array('b'),
+        'timezones': []
+    }
+
+def chunked(numbers: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Split any iterable into lists of at most chunk_size items"""
+    iterator = iter(numbers)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def warm_up():
+    """Load phonenumbers metadata for every configured country up front"""
+    if not PHONENUMBERS_AVAILABLE:
+        return
+    
+    geocoder = LazyModule('phonenumbers.geocoder')
+    carrier = LazyModule('phonenumbers.carrier')
+    
+    for code in COUNTRY_CODES:
+        for region in phonenumbers.region_codes_for_country_code(int(code[1:])):
+            for number_type in (phonenumbers.PhoneNumberType.MOBILE, phonenumbers.PhoneNumberType.FIXED_LINE):
+                example = phonenumbers.example_number_for_type(region, number_type)
+                if example is None:
+                    continue
+                phonenumbers.is_valid_number(example)
+                geocoder.description_for_number(example, "en")
+                carrier.name_for_number(example, "en")
+                pn_timezone.time_zones_for_number(example)
+
+def parallel_map_chunks(func: Callable, chunks: Iterable, workers: int,
+                        initializer: Callable = warm_up) -> Iterator:
+    """Run func over chunks in a process pool and yield results in input order
+    
+    At most two chunks per worker are in flight, so the input iterator is
+    consumed lazily and memory stays bounded regardless of input size.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+class BatchAnalysisEngine:
+    """Chunked, columnar analysis using real phonenumbers metadata only"""
+
+    def __init__(self, chunk_size: int = None, workers: int = None, stage_timings=None):
+        if not PHONENUMBERS_AVAILABLE:
+            raise ImportError("phonenumbers library required for batch analysis")
+
+        self.chunk_size = chunk_size or ANALYSIS_SETTINGS['chunk_size']
+        self.workers = workers or ANALYSIS_SETTINGS['workers']
+        # Optional metrics.StageTimings; pool workers (workers > 1) run in other
+        # processes and are not timed
+        self.stage_timings = stage_timings
+        # Country-level time zones depend only on the calling code, so they are
+        # shared across every chunk this engine processes
+        self._country_timezones = {}
+
+    def analyze_chunk(self, chunk: List[str]) -> Dict:
+        """Analyze one chunk of raw number strings into column arrays"""
+        columns = empty_columns()
+        input_col = columns['phone_number']
+        e164_col = columns['e164']
+        cc_col = columns['country_code']
+        region_col = columns['region']
+        type_col = columns['type']
+        valid_col = columns['is_valid']
+        tz_col = columns['timezones']
+
+        # Bind hot functions once per chunk
+        parse = phonenumbers.parse
+        region_for = phonenumbers.region_code_for_number
+        number_type = phonenumbers.number_type
+        is_geographical = phonenumbers.is_number_type_geographical
+        geo_timezones = pn_timezone.time_zones_for_geographical_number
+        all_timezones = pn_timezone.time_zones_for_number
+        country_timezones = self._country_timezones
+        labels = type_labels()
+        unknown = phonenumbers.PhoneNumberType.UNKNOWN
+        numobj = phonenumbers.PhoneNumber()
+        timings = self.stage_timings
+        start_clock = timings.start if timings is not None and timings.enabled else None
+
+        # Duplicates inside a chunk reuse the row computed for the first occurrence
+        seen = {}
+
+        for raw in chunk:
+            raw = raw.strip()
+            row = seen.get(raw)
+            if row is None:
+                clock = start_clock() if start_clock else None
+                text = raw if raw.startswith('+') else '+' + raw
+                try:
+                    numobj.clear()
+                    parse(text, None, numobj=numobj)
+                except Exception:
+                    row = ('', 0, '', 'Unknown', 0, ())
+                    if clock:
+                        clock.lap('batch_parse')
+                else:
+                    if clock:
+                        clock.lap('batch_parse')
+                    cc = numobj.country_code
+                    region = region_for(numobj) or ''
+                    ntype = number_type(numobj)
+                    if clock:
+                        clock.lap('batch_number_type')
+
+                    if ntype != unknown and is_geographical(ntype, cc):
+                        zones = tuple(geo_timezones(numobj))
+                    else:
+                        key = (cc, ntype == unknown)
+                        zones = country_timezones.get(key)
+                        if zones is None:
+                            zones = country_timezones[key] = tuple(all_timezones(numobj))
+                    if clock:
+                        clock.lap('batch_timezones')
+
+                    leading = '0' * (numobj.number_of_leading_zeros or 1) if numobj.italian_leading_zero else ''
+                    row = (
+                        f"+{cc}{leading}{numobj.national_number}",
+                        cc,
+                        region,
+                        labels.get(ntype, "Unknown"),
+                        1 if ntype != unknown and region else 0,
+                        zones
+                    )
+                    if clock:
+                        clock.lap('batch_row_build')
+                seen[raw] = row
+                if clock:
+                    clock.finish('batch_total')
+
+            input_col.append(raw)
+            e164_col.append(row[0])
+            cc_col.append(row[1])
+            region_col.append(row[2])
+            type_col.append(row[3])
+            valid_col.append(row[4])
+            tz_col.append(row[5])
+
+        return columns
+
+    def iter_chunks(self, numbers: Iterable[str]) -> Iterator[Dict]:
+        """Yield column arrays chunk by chunk (input may be any iterator)"""
+        chunks = chunked(numbers, self.chunk_size)
+        if self.workers > 1:
+            yield from parallel_map_chunks(_analyze_chunk_in_worker, chunks, self.workers)
+        else:
+            for chunk in chunks:
+                yield self.analyze_chunk(chunk)
+
+    def analyze(self, numbers: Iterable[str]) -> Dict:
+        """Analyze all numbers and return one combined set of column arrays"""
+        columns = empty_columns()
+        for chunk_columns in self.iter_chunks(numbers):
+            for name in COLUMNS:
+                columns[name].extend(chunk_columns[name])
+        return columns
+
+# Per-process engine used by pool workers (keeps the country time zone cache warm)
+_worker_engine = None
+
+def _analyze_chunk_in_worker(chunk: List[str]) -> Dict:
+    """Process pool entry point for BatchAnalysisEngine"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = BatchAnalysisEngine(workers=1)
+    return _worker_engine.analyze_chunk(chunk)
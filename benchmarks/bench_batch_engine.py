@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-number fast analysis vs columnar batch engine
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Usage:
+    python benchmarks/bench_batch_engine.py [--count N] [--chunk-size N]
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advanced_lookup import AdvancedPhoneLookup
+from batch_engine import BatchAnalysisEngine
+from benchmarks.corpus import generate_numbers
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-number and columnar batch throughput')
+    parser.add_argument('--count', type=int, default=100000, help='Numbers to analyze (default: 100000)')
+    parser.add_argument('--chunk-size', type=int, default=None, help='Batch engine chunk size')
+    args = parser.parse_args()
+    
+    numbers = generate_numbers(args.count)
+    
+    tool = AdvancedPhoneLookup(engine='fast')
+    tool.logger.setLevel(logging.WARNING)
+    tool.comprehensive_analysis(numbers[0])
+    
+    start = time.perf_counter()
+    for number in numbers:
+        tool.comprehensive_analysis(number)
+    per_number = time.perf_counter() - start
+    
+    engine = BatchAnalysisEngine(args.chunk_size)
+    start = time.perf_counter()
+    engine.analyze(numbers)
+    columnar = time.perf_counter() - start
+    
+    print(f"per-number fast analysis: {args.count / per_number * 60:14,.0f} numbers/min")
+    print(f"columnar batch engine:    {args.count / columnar * 60:14,.0f} numbers/min")
+    print(f"speedup:                  {per_number / columnar:14.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: simulation engine vs fast engine throughput
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Usage:
+    python benchmarks/bench_engine_modes.py [--fast-count N] [--simulation-count N]
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advanced_lookup import AdvancedPhoneLookup
+from benchmarks.corpus import generate_numbers
+
+def measure(tool: AdvancedPhoneLookup, numbers, engine: str) -> float:
+    """Return numbers analyzed per second for the given engine"""
+    start = time.perf_counter()
+    for number in numbers:
+        tool.comprehensive_analysis(number, engine)
+    elapsed = time.perf_counter() - start
+    return len(numbers) / elapsed if elapsed else float('inf')
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare analysis engine throughput')
+    parser.add_argument('--fast-count', type=int, default=10000, help='Numbers for the fast engine (default: 10000)')
+    parser.add_argument('--simulation-count', type=int, default=3, help='Numbers for the simulation engine (default: 3)')
+    args = parser.parse_args()
+    
+    tool = AdvancedPhoneLookup()
+    tool.logger.setLevel(logging.WARNING)
+    
+    # Warm up phonenumbers metadata so the first country does not pay the load cost
+    tool.comprehensive_analysis(generate_numbers(1)[0], 'fast')
+    
+    simulation_rate = measure(tool, generate_numbers(args.simulation_count, seed=1), 'simulation')
+    fast_rate = measure(tool, generate_numbers(args.fast_count, seed=2), 'fast')
+    
+    print(f"simulation: {simulation_rate:12.2f} numbers/sec ({args.simulation_count} numbers)")
+    print(f"fast:       {fast_rate:12.2f} numbers/sec ({args.fast_count} numbers)")
+    print(f"speedup:    {fast_rate / simulation_rate:12.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: columnar batch engine scaling across worker processes
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Usage:
+    python benchmarks/bench_parallel.py [--count N] [--max-workers N]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_engine import BatchAnalysisEngine
+from benchmarks.corpus import generate_numbers
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure process pool scaling')
+    parser.add_argument('--count', type=int, default=500000, help='Numbers to analyze (default: 500000)')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count(), help='Largest worker count to try')
+    args = parser.parse_args()
+    
+    numbers = generate_numbers(args.count)
+    worker_counts = sorted({1, *[2 ** i for i in range(1, 7) if 2 ** i <= args.max_workers], args.max_workers})
+    baseline = None
+    
+    for workers in worker_counts:
+        engine = BatchAnalysisEngine(workers=workers)
+        start = time.perf_counter()
+        for _ in engine.iter_chunks(numbers):
+            pass
+        rate = args.count / (time.perf_counter() - start) * 60
+        baseline = baseline or rate
+        print(f"workers={workers:3d}: {rate:14,.0f} numbers/min  ({rate / baseline:5.2f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memory per result, PhoneAnalysisResult list vs CompactResultStore
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Usage:
+    python benchmarks/bench_result_memory.py [--count N]
+"""
+
+import os
+import sys
+import logging
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from advanced_lookup import AdvancedPhoneLookup, PhoneAnalysisResult
+from result_store import CompactResultStore
+from benchmarks.corpus import generate_numbers
+
+def measure(numbers, tool, container) -> float:
+    """Return bytes allocated per result kept in container"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for number in numbers:
+        container.append(tool.comprehensive_analysis(number))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(numbers)
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure memory per stored result')
+    parser.add_argument('--count', type=int, default=50000, help='Results to store (default: 50000)')
+    args = parser.parse_args()
+    
+    # Measure storage only, not the result caches
+    config.DATABASE_SETTINGS['cache_results'] = False
+    config.DATABASE_SETTINGS['use_database'] = False
+    
+    numbers = generate_numbers(args.count)
+    tool = AdvancedPhoneLookup(engine='fast')
+    tool.logger.setLevel(logging.WARNING)
+    tool.comprehensive_analysis(numbers[0])
+    
+    full = []
+    full_bytes = measure(numbers, tool, full)
+    del full
+    
+    compact = CompactResultStore(PhoneAnalysisResult)
+    compact_bytes = measure(numbers, tool, compact)
+    
+    print(f"PhoneAnalysisResult list: {full_bytes:10,.0f} bytes/result")
+    print(f"CompactResultStore:       {compact_bytes:10,.0f} bytes/result")
+    print(f"reduction:                {full_bytes / compact_bytes:10.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: CLI startup time
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Times fresh interpreter runs: importing each module and one-shot CLI
+invocations. Runs happen in a temporary directory so results/ and logs/
+are not touched.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = (
+    ('import advanced_lookup', ['-c', 'import advanced_lookup']),
+    ('import phone_lookup', ['-c', 'import phone_lookup']),
+    ('import web_interface', ['-c', 'import web_interface']),
+    ('advanced_lookup.py --help', [os.path.join(ROOT, 'advanced_lookup.py'), '--help']),
+    ('one-shot fast lookup', [os.path.join(ROOT, 'advanced_lookup.py'), '+966501234567', '--engine', 'fast'])
+)
+
+def measure(args, runs: int, cwd: str):
+    """Return wall-clock seconds of each run of `python <args>`"""
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE='1')
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure CLI startup time')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per case (default: 5)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        baseline = statistics.median(measure(['-c', 'pass'], args.runs, cwd))
+        print(f"{'bare interpreter':28s} median {baseline * 1000:8.1f} ms")
+
+        for name, case_args in CASES:
+            timings = measure(case_args, args.runs, cwd)
+            print(f"{name:28s} median {statistics.median(timings) * 1000:8.1f} ms   "
+                  f"min {min(timings) * 1000:8.1f} ms")
+
+if __name__ == '__main__':
+    main()
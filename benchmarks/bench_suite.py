@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite: hot analysis paths with machine-readable baselines
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Runs every path against a synthetic and a realistic corpus and reports
+ops/sec, p50/p99 latency and peak RSS. Each path runs in a fresh
+interpreter so peak RSS belongs to that path alone. The simulation engine
+sleeps on purpose, so the analysis paths use the fast engine with result
+caches disabled.
+
+Usage:
+    python benchmarks/bench_suite.py [--count N] [--rounds N] [--paths a,b] [--save FILE]
+    python benchmarks/bench_suite.py --compare FILE [--tolerance 0.10]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import generate_numbers, generate_realistic_numbers
+
+CORPORA = {
+    'synthetic': generate_numbers,
+    'realistic': generate_realistic_numbers
+}
+
+# Numbers per batch_analysis call
+BATCH_SIZE = 1000
+
+def _phone_lookup_tool():
+    from phone_lookup import PhoneLookupTool
+    tool = PhoneLookupTool(engine='fast')
+    tool.logger.setLevel(logging.WARNING)
+    return tool
+
+def _advanced_tool():
+    from advanced_lookup import AdvancedPhoneLookup
+    tool = AdvancedPhoneLookup(engine='fast')
+    tool.logger.setLevel(logging.WARNING)
+    tool.cache = None
+    tool.db_cache = None
+    return tool
+
+def _batches(numbers):
+    return [numbers[i:i + BATCH_SIZE] for i in range(0, len(numbers), BATCH_SIZE)]
+
+# name -> (setup() returning a callable, how inputs are grouped per call)
+PATHS = {
+    'phone_lookup.validate_phone_number': (lambda: _phone_lookup_tool().validate_phone_number, None),
+    'phone_lookup.format_phone_number': (lambda: _phone_lookup_tool().format_phone_number, None),
+    'phone_lookup.detect_country_and_carrier': (lambda: _phone_lookup_tool().detect_country_and_carrier, None),
+    'advanced_lookup.validate_phone_number': (lambda: _advanced_tool().validate_phone_number, None),
+    'advanced_lookup.analyze_with_phonenumbers': (lambda: _advanced_tool().analyze_with_phonenumbers, None),
+    'advanced_lookup.comprehensive_analysis': (lambda: _advanced_tool().comprehensive_analysis, None),
+    'advanced_lookup.batch_analysis': (lambda: _advanced_tool().batch_analysis, _batches)
+}
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reports bytes
+
+def run_path(name: str, corpus: str, count: int, seed: int, rounds: int = 3) -> dict:
+    """Measure one path on one corpus in this process (fastest of `rounds` runs)"""
+    setup, group = PATHS[name]
+    func = setup()
+    numbers = CORPORA[corpus](count, seed)
+    calls = group(numbers) if group else numbers
+
+    # Warm up metadata loading and lazy imports outside the measurement
+    for item in calls[:max(1, len(calls) // 100)]:
+        func(item)
+
+    # batch_analysis prints progress; keep it out of the timing output
+    devnull = open(os.devnull, 'w')
+    stdout, sys.stdout = sys.stdout, devnull
+    best = None
+    try:
+        perf_counter = time.perf_counter
+        for _ in range(rounds):
+            latencies = []
+            for item in calls:
+                start = perf_counter()
+                func(item)
+                latencies.append(perf_counter() - start)
+            if best is None or sum(latencies) < sum(best):
+                best = latencies
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+
+    latencies = sorted(best)
+    total = sum(latencies)
+    return {
+        'path': name,
+        'corpus': corpus,
+        'numbers': len(numbers),
+        'calls': len(calls),
+        'rounds': rounds,
+        'ops_per_sec': len(numbers) / total if total else float('inf'),
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'peak_rss_kb': peak_rss_kb()
+    }
+
+def run_isolated(name: str, corpus: str, count: int, seed: int, rounds: int) -> dict:
+    """Run one measurement in a fresh interpreter and return its result"""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', name, corpus,
+         '--count', str(count), '--seed', str(seed), '--rounds', str(rounds)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def compare(results: list, baseline_file: str, tolerance: float) -> bool:
+    """Print throughput changes against a baseline; return False on regressions"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = {(r['path'], r['corpus']): r for r in json.load(f)['results']}
+
+    ok = True
+    print(f"\nAgainst {baseline_file} (tolerance {tolerance:.0%}):")
+    for result in results:
+        previous = baseline.get((result['path'], result['corpus']))
+        if previous is None:
+            continue
+        change = result['ops_per_sec'] / previous['ops_per_sec'] - 1
+        regressed = change < -tolerance
+        ok = ok and not regressed
+        print(f"  {'REGRESSION' if regressed else 'ok':10s} {result['path']:42s} {result['corpus']:9s} {change:+7.1%}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the analysis hot paths')
+    parser.add_argument('--count', type=int, default=20000, help='Numbers per corpus (default: 20000)')
+    parser.add_argument('--seed', type=int, default=42, help='Corpus seed (default: 42)')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed rounds per path, fastest kept (default: 3)')
+    parser.add_argument('--paths', help=f"Comma-separated subset of: {', '.join(PATHS)}")
+    parser.add_argument('--corpora', default=','.join(CORPORA), help='Comma-separated corpora (default: all)')
+    parser.add_argument('--save', help='Write results as a JSON baseline to this file')
+    parser.add_argument('--compare', help='Compare against a saved baseline; exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='Allowed ops/sec drop for --compare (default: 0.10)')
+    parser.add_argument('--child', nargs=2, metavar=('PATH', 'CORPUS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_path(args.child[0], args.child[1], args.count, args.seed, args.rounds)))
+        return
+
+    paths = args.paths.split(',') if args.paths else list(PATHS)
+    corpora = args.corpora.split(',')
+    unknown = [p for p in paths if p not in PATHS] + [c for c in corpora if c not in CORPORA]
+    if unknown:
+        parser.error(f"Unknown path or corpus: {', '.join(unknown)}")
+
+    print(f"{'path':42s} {'corpus':9s} {'ops/sec':>12s} {'p50 us':>10s} {'p99 us':>10s} {'peak RSS MiB':>13s}")
+    results = []
+    for name in paths:
+        for corpus in corpora:
+            result = run_isolated(name, corpus, args.count, args.seed, args.rounds)
+            results.append(result)
+            rss = f"{result['peak_rss_kb'] / 1024:13.1f}" if result['peak_rss_kb'] else f"{'n/a':>13s}"
+            print(f"{name:42s} {corpus:9s} {result['ops_per_sec']:12,.0f} "
+                  f"{result['p50_us']:10.1f} {result['p99_us']:10.1f} {rss}")
+
+    if args.save:
+        baseline = {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'count': args.count,
+            'seed': args.seed,
+            'rounds': args.rounds,
+            'batch_size': BATCH_SIZE,
+            'results': results
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nBaseline saved to: {args.save}")
+
+    if args.compare and not compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic phone number corpora for benchmarks
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+"""
+
+import os
+import sys
+import random
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import COUNTRY_CODES
+
+# Subscriber number length (digits after the country code) per country
+NATIONAL_LENGTHS = {
+    '+966': 9, '+1': 10, '+44': 10, '+971': 9, '+965': 8, '+973': 8,
+    '+974': 8, '+968': 8, '+962': 9, '+961': 8, '+20': 10
+}
+
+def generate_numbers(count: int, seed: int = 42) -> List[str]:
+    """Generate a deterministic list of E.164 numbers spread across COUNTRY_CODES"""
+    rng = random.Random(seed)
+    codes = list(COUNTRY_CODES.keys())
+    numbers = []
+    
+    for _ in range(count):
+        code = rng.choice(codes)
+        length = NATIONAL_LENGTHS.get(code, 9)
+        prefixes = COUNTRY_CODES[code]['mobile_prefixes'] or ['2']
+        prefix = rng.choice(prefixes)
+        rest = ''.join(rng.choice('0123456789') for _ in range(length - len(prefix)))
+        numbers.append(f"{code}{prefix}{rest}")
+    
+    return numbers
+
+def generate_realistic_numbers(count: int, seed: int = 42, duplicate_ratio: float = 0.3) -> List[str]:
+    """Generate user-style input: mixed formatting, some invalid entries and repeats
+    
+    Numbers come from generate_numbers and are written the way people type
+    them (spaces, dashes, parentheses, 00 prefix). About 5% are malformed and
+    duplicate_ratio of the entries repeat an earlier number, as real
+    batches do.
+    """
+    rng = random.Random(seed)
+    base = generate_numbers(count, seed)
+    numbers = []
+    
+    for number in base:
+        if numbers and rng.random() < duplicate_ratio:
+            numbers.append(rng.choice(numbers))
+            continue
+        
+        roll = rng.random()
+        if roll < 0.05:
+            number = number[:rng.randint(2, 6)] + rng.choice(['abc', '', '#'])  # malformed
+        elif roll < 0.25:
+            number = f"{number[:4]} {number[4:7]} {number[7:]}"
+        elif roll < 0.40:
+            number = f"{number[:4]}-{number[4:7]}-{number[7:]}"
+        elif roll < 0.50:
+            number = f"{number[:4]} ({number[4:6]}) {number[6:]}"
+        elif roll < 0.60:
+            number = "00" + number[1:]
+        numbers.append(number)
+    
+    return numbers
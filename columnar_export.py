@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar Export (Parquet / Arrow IPC)
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Typed, columnar output for warehouse loads. Chunks are written as Parquet
+row groups or Arrow record batches, and low-cardinality text fields are
+dictionary-encoded. Requires the optional pyarrow package.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from lazy_imports import LazyModule, module_available
+
+# pyarrow is imported on first use
+PYARROW_AVAILABLE = module_available('pyarrow')
+pa = LazyModule('pyarrow')
+pa_ipc = LazyModule('pyarrow.ipc')
+pq = LazyModule('pyarrow.parquet')
+
+# Binary formats handled here
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow library required for Parquet/Arrow export (pip install pyarrow)")
+
+def _dictionary():
+    return pa.dictionary(pa.int32(), pa.string())
+
+def stream_schema():
+    """Schema of the streaming pipeline columns (batch_engine.COLUMNS)"""
+    _require_pyarrow()
+    return pa.schema([
+        ('phone_number', pa.string()),
+        ('e164', pa.string()),
+        ('country_code', pa.uint16()),
+        ('region', _dictionary()),
+        ('type', _dictionary()),
+        ('is_valid', pa.bool_()),
+        ('timezones', pa.list_(pa.string()))
+    ])
+
+def result_schema():
+    """Schema of full PhoneAnalysisResult exports (the export_to_csv fields)"""
+    _require_pyarrow()
+    return pa.schema([
+        ('phone_number', pa.string()),
+        ('formatted_number', pa.string()),
+        ('country_code', _dictionary()),
+        ('country_name', _dictionary()),
+        ('region', _dictionary()),
+        ('carrier', _dictionary()),
+        ('line_type', _dictionary()),
+        ('timezone', pa.list_(pa.string())),
+        ('is_valid', pa.bool_()),
+        ('is_possible', pa.bool_()),
+        ('confidence_score', pa.float64()),
+        ('analysis_timestamp', pa.timestamp('us')),
+        ('educational_note', _dictionary())
+    ])
+
+def _column(values, arrow_type):
+    """Convert one column (list or typed array.array) to an Arrow array"""
+    if isinstance(values, array):
+        if arrow_type == pa.bool_():
+            return pa.Array.from_buffers(pa.int8(), len(values), [None, pa.py_buffer(values)]).cast(pa.bool_())
+        # Zero-copy view of the machine-typed buffer
+        return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+    return pa.array(values, type=arrow_type)
+
+def columns_to_batch(columns: Dict, schema) -> 'pa.RecordBatch':
+    """Build a record batch from a dict of equally long columns"""
+    return pa.record_batch([_column(columns[field.name], field.type) for field in schema], schema=schema)
+
+def results_to_batch(results: List, schema=None) -> 'pa.RecordBatch':
+    """Build a record batch from PhoneAnalysisResult objects"""
+    schema = schema or result_schema()
+    columns = {field.name: [] for field in schema}
+    for result in results:
+        for name in columns:
+            value = getattr(result, name)
+            if name == 'analysis_timestamp':
+                value = datetime.fromisoformat(value)
+            columns[name].append(value)
+    return columns_to_batch(columns, schema)
+
+class ColumnarWriter:
+    """Base writer: one Parquet row group / Arrow record batch per chunk"""
+
+    binary = True
+
+    def __init__(self, f, schema=None):
+        _require_pyarrow()
+        self.f = f
+        self.schema = schema or stream_schema()
+        self.writer = None
+
+    def write_chunk(self, columns: Dict):
+        self.write_batch(columns_to_batch(columns, self.schema))
+
+    def write_batch(self, batch):
+        if batch.num_rows:
+            self.writer.write_batch(batch)
+
+    def close(self):
+        self.writer.close()
+
+class ParquetWriter(ColumnarWriter):
+    """Write chunks as row groups of a zstd-compressed Parquet file"""
+
+    def __init__(self, f, schema=None):
+        super().__init__(f, schema)
+        self.writer = pq.ParquetWriter(f, self.schema, compression='zstd')
+
+class ArrowWriter(ColumnarWriter):
+    """Write chunks as record batches of an Arrow IPC stream
+
+    The stream format is used because each chunk carries its own
+    dictionaries; read it back with pyarrow.ipc.open_stream.
+    """
+
+    def __init__(self, f, schema=None):
+        super().__init__(f, schema)
+        self.writer = pa_ipc.new_stream(f, self.schema)
+
+COLUMNAR_WRITERS = {
+    'parquet': ParquetWriter,
+    'arrow': ArrowWriter
+}
+
+def write_results(f, results: Iterable, output_format: str, chunk_size: int) -> int:
+    """Write PhoneAnalysisResult objects to f in chunks; returns the row count"""
+    schema = result_schema()
+    writer = COLUMNAR_WRITERS[output_format](f, schema)
+    total = 0
+    chunk = []
+    for result in results:
+        chunk.append(result)
+        if len(chunk) >= chunk_size:
+            writer.write_batch(results_to_batch(chunk, schema))
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        writer.write_batch(results_to_batch(chunk, schema))
+        total += len(chunk)
+    writer.close()
+    return total
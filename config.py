@@ -41,7 +41,14 @@ COUNTRY_CODES = {
         'country': 'Saudi Arabia',
         'country_ar': 'المملكة العربية السعودية',
         'carriers': ['STC', 'Mobily', 'Zain', 'Virgin Mobile'],
-        'mobile_prefixes': ['50', '51', '52', '53', '54', '55', '56', '57', '58', '59']
+        'mobile_prefixes': ['50', '51', '52', '53', '54', '55', '56', '57', '58', '59'],
+        # National number prefix -> carrier (longest prefix wins)
+        'carrier_prefixes': {
+            '50': 'STC', '53': 'STC', '56': 'STC',
+            '51': 'Mobily', '54': 'Mobily', '57': 'Mobily',
+            '52': 'Zain', '55': 'Zain', '58': 'Zain',
+            '59': 'Virgin Mobile'
+        }
     },
     '+1': {
         'country': 'United States/Canada',
@@ -125,12 +132,31 @@ API_CONFIG = {
 # Output Settings
 OUTPUT_SETTINGS = {
     'save_results': True,
-    'output_format': 'json',  # json, csv, txt
+    'output_format': 'json',  # json (one indented document) or jsonl (one compact record per line)
     'output_directory': 'results',
     'include_timestamp': True,
     'pretty_print': True
 }
 
+# Web Interface Settings
+WEB_SETTINGS = {
+    'batch_max_numbers': 50,  # limit for the interactive /batch_analyze endpoint
+    'bulk_max_numbers': 100000,  # limit for /api/bulk_analyze
+    'bulk_save_results': False,  # persist bulk results to output_directory by default
+    'job_workers': 2,  # background analysis jobs running at once
+    'job_max_pending': 10,  # queued + running jobs before new submissions are rejected
+    'job_history': 100,  # finished jobs (and their result files) kept for download
+    'server': 'development',  # development (Flask built-in) or asgi (uvicorn)
+    'server_workers': 1,  # asgi server processes (background jobs need exactly one)
+    'server_threads': 64,  # per-process threads running request handlers
+    'keep_alive': 5,  # seconds an idle keep-alive connection stays open
+    'max_concurrency': 1000,  # connections + tasks per process before 503s
+    'backlog': 2048,  # pending TCP connections
+    'analyze_persistence': 'rollup',  # none, log (JSONL append), rollup (file per interval) or file (per request)
+    'persistence_interval': 60,  # seconds between background flushes
+    'persistence_max_buffer': 1000  # flush early once this many results are buffered
+}
+
 # Security Settings
 SECURITY_SETTINGS = {
     'educational_mode': True,  # Always keep True for educational use
@@ -159,13 +185,29 @@ GUI_SETTINGS = {
     'language': 'ar'  # ar for Arabic, en for English
 }
 
-# Database Settings (for future database integration)
+# Database Settings (persistent SQLite result cache)
 DATABASE_SETTINGS = {
     'use_database': False,
     'db_type': 'sqlite',
     'db_file': 'phone_lookup.db',
+    'batch_size': 500,  # cached results buffered before each commit
     'cache_results': True,
-    'cache_duration': 3600  # seconds
+    'cache_duration': 3600,  # seconds
+    'cache_size': 10000  # max results kept in the in-memory LRU cache
+}
+
+# Analysis Engine Settings
+# 'simulation' runs the educational simulation (with artificial delays),
+# 'fast' skips it and returns only real phonenumbers metadata
+ANALYSIS_ENGINES = ('simulation', 'fast')
+
+ANALYSIS_SETTINGS = {
+    'engine': 'simulation',
+    'chunk_size': 10000,  # numbers per chunk for the columnar batch engine
+    'workers': 1,  # worker processes for fast batch analysis (1 = in-process)
+    'compact_results': False,  # keep batch results in a CompactResultStore (drops additional_info)
+    'stage_timing': False,  # record per-stage durations of comprehensive_analysis and the batch engine
+    'metadata_cache_size': 100000  # geocoder/carrier/timezone answers memoized per prefix (0 = off)
 }
 
 # Validation Rules
@@ -206,10 +248,12 @@ def get_config(section: str = None) -> Dict:
         'app': APP_SETTINGS,
         'api': API_CONFIG,
         'output': OUTPUT_SETTINGS,
+        'web': WEB_SETTINGS,
         'security': SECURITY_SETTINGS,
         'logging': LOGGING_CONFIG,
         'gui': GUI_SETTINGS,
         'database': DATABASE_SETTINGS,
+        'analysis': ANALYSIS_SETTINGS,
         'validation': VALIDATION_RULES,
         'countries': COUNTRY_CODES,
         'developer': DEVELOPER_INFO
@@ -225,7 +269,8 @@ def get_country_info(country_code: str) -> Dict:
         'country': 'Unknown',
         'country_ar': 'غير معروف',
         'carriers': [],
-        'mobile_prefixes': []
+        'mobile_prefixes': [],
+        'carrier_prefixes': {}
     })
 
 def is_educational_mode() -> bool:
@@ -248,6 +293,27 @@ def load_env_config():
     
     if os.getenv('PHONE_LOOKUP_OUTPUT_DIR'):
         OUTPUT_SETTINGS['output_directory'] = os.getenv('PHONE_LOOKUP_OUTPUT_DIR')
+    
+    if os.getenv('PHONE_LOOKUP_USE_DATABASE'):
+        DATABASE_SETTINGS['use_database'] = os.getenv('PHONE_LOOKUP_USE_DATABASE').lower() == 'true'
+    
+    if os.getenv('PHONE_LOOKUP_DB_FILE'):
+        DATABASE_SETTINGS['db_file'] = os.getenv('PHONE_LOOKUP_DB_FILE')
+    
+    if os.getenv('PHONE_LOOKUP_ENGINE') in ANALYSIS_ENGINES:
+        ANALYSIS_SETTINGS['engine'] = os.getenv('PHONE_LOOKUP_ENGINE')
+    
+    if os.getenv('PHONE_LOOKUP_STAGE_TIMING'):
+        ANALYSIS_SETTINGS['stage_timing'] = os.getenv('PHONE_LOOKUP_STAGE_TIMING').lower() == 'true'
+    
+    if os.getenv('PHONE_LOOKUP_PERSISTENCE'):
+        WEB_SETTINGS['analyze_persistence'] = os.getenv('PHONE_LOOKUP_PERSISTENCE')
+    
+    if os.getenv('PHONE_LOOKUP_SERVER_THREADS'):
+        WEB_SETTINGS['server_threads'] = int(os.getenv('PHONE_LOOKUP_SERVER_THREADS'))
+    
+    if os.getenv('PHONE_LOOKUP_SERVER_WORKERS'):
+        WEB_SETTINGS['server_workers'] = int(os.getenv('PHONE_LOOKUP_SERVER_WORKERS'))
 
 # Load environment configuration on import
 load_env_config()
\ No newline at end of file
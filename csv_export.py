@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming CSV Export
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Dependency-free CSV export built on the csv module. Rows are written as
+results are produced, optionally through gzip or zstd compression.
+"""
+
+import csv
+import gzip
+from typing import IO, Iterable, Optional
+
+from lazy_imports import LazyModule, module_available
+
+# zstandard is imported on first use
+ZSTANDARD_AVAILABLE = module_available('zstandard')
+zstandard = LazyModule('zstandard')
+
+# Column headers and the PhoneAnalysisResult fields they come from
+CSV_COLUMNS = (
+    ('Phone Number', 'phone_number'),
+    ('Formatted Number', 'formatted_number'),
+    ('Country Code', 'country_code'),
+    ('Country Name', 'country_name'),
+    ('Region', 'region'),
+    ('Carrier', 'carrier'),
+    ('Line Type', 'line_type'),
+    ('Timezone', 'timezone'),
+    ('Is Valid', 'is_valid'),
+    ('Is Possible', 'is_possible'),
+    ('Confidence Score', 'confidence_score'),
+    ('Analysis Timestamp', 'analysis_timestamp'),
+    ('Educational Note', 'educational_note')
+)
+
+# Supported compression and the file suffix that selects it
+COMPRESSION_SUFFIXES = {
+    'gzip': '.gz',
+    'zstd': '.zst'
+}
+
+def compression_for(path: str) -> Optional[str]:
+    """Infer the compression from a file name suffix (None for plain text)"""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+def open_text_output(path: str, compression: Optional[str] = None) -> IO[str]:
+    """Open path for text writing, compressed with gzip or zstd if requested"""
+    if compression is None:
+        return open(path, 'w', encoding='utf-8', newline='')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    if compression == 'zstd':
+        if not ZSTANDARD_AVAILABLE:
+            raise ImportError("zstandard library required for zstd compression (pip install zstandard)")
+        return zstandard.open(path, 'w', encoding='utf-8', newline='')
+    raise ValueError(f"Unsupported compression: {compression} (use {', '.join(COMPRESSION_SUFFIXES)})")
+
+class ResultCSVWriter:
+    """Write PhoneAnalysisResult objects as CSV_COLUMNS rows, chunk by chunk"""
+
+    binary = False
+
+    def __init__(self, f: IO[str]):
+        self.writer = csv.writer(f, lineterminator='\n')  # same line endings as the former pandas export
+        self.writer.writerow([header for header, _ in CSV_COLUMNS])
+        self.fields = [field for _, field in CSV_COLUMNS]
+        self.timezone_index = self.fields.index('timezone')
+
+    def write_chunk(self, results: Iterable) -> int:
+        """Write one row per result; returns the row count"""
+        total = 0
+        for result in results:
+            row = [getattr(result, field) for field in self.fields]
+            row[self.timezone_index] = ', '.join(row[self.timezone_index])
+            self.writer.writerow(row)
+            total += 1
+        return total
+
+    def close(self):
+        pass
+
+def write_results_csv(f: IO[str], results: Iterable) -> int:
+    """Write PhoneAnalysisResult objects as CSV rows; returns the row count"""
+    return ResultCSVWriter(f).write_chunk(results)
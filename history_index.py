@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analysis History Index
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+SQLite index of saved result files, maintained when results are saved.
+History pages are served from an indexed query instead of listing and
+stat-ing every file in the results directory.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    filename TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    total_numbers INTEGER NOT NULL,
+    countries TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_created_at ON history (created_at);
+
+-- One row per (country, file), so country filters are index range scans
+CREATE TABLE IF NOT EXISTS history_countries (
+    country TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (country, filename)
+);
+CREATE INDEX IF NOT EXISTS history_countries_created_at ON history_countries (country, created_at);
+CREATE INDEX IF NOT EXISTS history_countries_filename ON history_countries (filename);
+
+-- Row count kept by triggers, so unfiltered pages do not COUNT(*) the table
+CREATE TABLE IF NOT EXISTS history_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS history_inserted AFTER INSERT ON history
+BEGIN
+    UPDATE history_stats SET total = total + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS history_deleted AFTER DELETE ON history
+BEGIN
+    UPDATE history_stats SET total = total - 1 WHERE id = 0;
+    DELETE FROM history_countries WHERE filename = OLD.filename;
+END;
+"""
+
+class HistoryIndex:
+    """Index of saved analysis files supporting paginated, filtered queries"""
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        self.results_dir = os.path.dirname(db_file) or '.'
+        self._local = threading.local()
+        is_new = not os.path.exists(db_file)
+
+        conn = self._connection()
+        has_countries = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'history_countries'"
+        ).fetchone() is not None
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.execute("INSERT OR IGNORE INTO history_stats (id, total) SELECT 0, COUNT(*) FROM history")
+            if not has_countries:
+                # Index written before the country table existed
+                rows = conn.execute("SELECT filename, created_at, countries FROM history").fetchall()
+                conn.executemany(
+                    "INSERT OR IGNORE INTO history_countries (country, filename, created_at) VALUES (?, ?, ?)",
+                    [(code, filename, created_at)
+                     for filename, created_at, countries in rows
+                     for code in countries.split(',') if code]
+                )
+
+        if is_new:
+            self.rebuild(self.results_dir)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _store(self, conn: sqlite3.Connection, filename: str, created_at: float, total_numbers: int,
+               countries: set):
+        """Insert or update one entry and its country rows (caller holds the transaction)"""
+        countries = sorted(code for code in countries if code)
+        conn.execute(
+            "INSERT INTO history (filename, created_at, total_numbers, countries) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (filename) DO UPDATE SET created_at = excluded.created_at, "
+            "total_numbers = excluded.total_numbers, countries = excluded.countries",
+            (filename, created_at, total_numbers, ',' + ','.join(countries) + ',')
+        )
+        conn.execute("DELETE FROM history_countries WHERE filename = ?", (filename,))
+        conn.executemany(
+            "INSERT INTO history_countries (country, filename, created_at) VALUES (?, ?, ?)",
+            [(code, filename, created_at) for code in countries]
+        )
+
+    def add(self, filename: str, created_at: float, total_numbers: int, countries: Iterable[str] = ()):
+        """Record a saved results file"""
+        conn = self._connection()
+        with conn:
+            self._store(conn, filename, created_at, total_numbers, set(countries))
+
+    def append(self, filename: str, created_at: float, added_numbers: int, countries: Iterable[str] = ()):
+        """Record numbers appended to a results file (daily logs), keeping its earlier totals"""
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT total_numbers, countries FROM history WHERE filename = ?", (filename,)
+            ).fetchone()
+            countries = set(countries)
+            if row is not None:
+                added_numbers += row[0]
+                countries.update(code for code in row[1].split(',') if code)
+            self._store(conn, filename, created_at, added_numbers, countries)
+
+    def remove(self, filename: str):
+        """Forget a results file"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM history WHERE filename = ?", (filename,))
+
+    def rebuild(self, results_dir: str):
+        """Index result files missing from the index and drop entries whose file is gone
+
+        Existing .json/.jsonl files are added with their modification time
+        (a one-off scan for older directories).
+        """
+        if not os.path.isdir(results_dir):
+            return
+        rows = []
+        present = set()
+        for entry in os.scandir(results_dir):
+            if entry.name.endswith(('.json', '.jsonl')) and entry.is_file():
+                present.add(entry.name)
+                rows.append((entry.name, entry.stat().st_mtime, 0, ','))
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO history (filename, created_at, total_numbers, countries) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            stale = [(filename,) for (filename,) in conn.execute("SELECT filename FROM history")
+                     if filename not in present]
+            conn.executemany("DELETE FROM history WHERE filename = ?", stale)
+
+    def query(self, limit: int = 20, offset: int = 0, since: Optional[float] = None,
+              until: Optional[float] = None, country: Optional[str] = None,
+              name: Optional[str] = None) -> Dict:
+        """Return one page of history entries, newest first, plus the filtered total
+
+        since/until are Unix timestamps, country a code such as "+966" and
+        name a substring of the file name. Entries on the page whose file
+        has been deleted are dropped from the index and the page is read
+        again.
+        """
+        while True:
+            page = self._query(limit, offset, since, until, country, name)
+            missing = [entry['name'] for entry in page['entries']
+                       if not os.path.exists(os.path.join(self.results_dir, entry['name']))]
+            if not missing:
+                return page
+            for filename in missing:
+                self.remove(filename)
+
+    def _query(self, limit: int, offset: int, since: Optional[float], until: Optional[float],
+               country: Optional[str], name: Optional[str]) -> Dict:
+        if country:
+            # Walk the (country, created_at) index instead of matching every row
+            source = "history_countries AS c JOIN history AS h ON h.filename = c.filename"
+            conditions, params = ["c.country = ?"], [country]
+            created_at = "c.created_at"
+        else:
+            source = "history AS h"
+            conditions, params = [], []
+            created_at = "h.created_at"
+        if since is not None:
+            conditions.append(f"{created_at} >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append(f"{created_at} <= ?")
+            params.append(until)
+        if name:
+            conditions.append("instr(h.filename, ?) > 0")
+            params.append(name)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        conn = self._connection()
+        rows = conn.execute(
+            f"SELECT h.filename, h.created_at, h.total_numbers, h.countries FROM {source} {where} "
+            f"ORDER BY {created_at} DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset)
+        ).fetchall()
+        if conditions:
+            total = conn.execute(f"SELECT COUNT(*) FROM {source} {where}", params).fetchone()[0]
+        else:
+            total = conn.execute("SELECT total FROM history_stats WHERE id = 0").fetchone()[0]
+
+        entries: List[Dict] = [
+            {
+                'name': filename,
+                'timestamp': created_at,
+                'total_numbers': total_numbers,
+                'countries': [code for code in countries.split(',') if code]
+            }
+            for filename, created_at, total_numbers, countries in rows
+        ]
+        return {'total': total, 'entries': entries}
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background Analysis Jobs
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Runs large analyses outside the request thread. A job's input is spooled to
+disk, streamed through the analysis pipeline by a bounded worker pool, and
+written to a result file that can be downloaded once the job completes.
+"""
+
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from stream_pipeline import STREAM_FORMATS, run_pipeline
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+class JobQueueFull(Exception):
+    """Raised when too many jobs are already queued or running"""
+
+class JobCancelled(Exception):
+    """Raised inside a running job to stop it after the current chunk"""
+
+class AnalysisJob:
+    """State of one background analysis job"""
+
+    def __init__(self, job_id: str, total: int, input_path: str, output_path: str,
+                 output_format: str, engine: str):
+        self.job_id = job_id
+        self.total = total
+        self.input_path = input_path
+        self.output_path = output_path
+        self.output_format = output_format
+        self.engine = engine
+        self.status = QUEUED
+        self.processed = 0
+        self.error = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.future = None
+
+    def to_dict(self) -> Dict:
+        """Public view of the job for status polling"""
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'engine': self.engine,
+            'format': self.output_format,
+            'total': self.total,
+            'processed': self.processed,
+            'progress': self.processed / self.total if self.total else 0.0,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+class JobManager:
+    """Bounded pool of background analysis jobs with backpressure and cancellation"""
+
+    def __init__(self, tool, jobs_dir: str, max_workers: int = 2, max_pending: int = 10,
+                 max_history: int = 100):
+        self.tool = tool
+        self.jobs_dir = jobs_dir
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analysis-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+        os.makedirs(jobs_dir, exist_ok=True)
+
+    def _pending_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATES)
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_history (caller holds the lock)"""
+        finished = [job for job in self._jobs.values() if job.status in FINISHED_STATES]
+        for job in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job.job_id]
+            for path in (job.input_path, job.output_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def submit(self, numbers: Iterable[str], engine: str = None, output_format: str = 'jsonl') -> AnalysisJob:
+        """Spool numbers to disk and queue a job; raises JobQueueFull when saturated"""
+        if output_format not in STREAM_FORMATS:
+            raise ValueError(f"Unsupported job format: {output_format}")
+
+        with self._lock:
+            if self._pending_count() >= self.max_pending:
+                raise JobQueueFull(f"Too many pending jobs (limit {self.max_pending}), try again later")
+            self._prune()
+
+            job_id = uuid.uuid4().hex
+            job = AnalysisJob(
+                job_id,
+                total=0,
+                input_path=os.path.join(self.jobs_dir, f"{job_id}.input.txt"),
+                output_path=os.path.join(self.jobs_dir, f"{job_id}.{output_format}"),
+                output_format=output_format,
+                engine=engine or self.tool.engine
+            )
+            # Register before spooling so concurrent submits count against the limit
+            self._jobs[job_id] = job
+
+        try:
+            with open(job.input_path, 'w', encoding='utf-8') as f:
+                for number in numbers:
+                    number = str(number).strip()
+                    if number:
+                        f.write(number + '\n')
+                        job.total += 1
+        except Exception:
+            with self._lock:
+                del self._jobs[job_id]
+            raise
+
+        # Cancelled while spooling: never queue it
+        if job.cancel_event.is_set():
+            self._finish_cancelled(job)
+            return job
+
+        job.future = self._executor.submit(self._run, job)
+        return job
+
+    def _finish_cancelled(self, job: AnalysisJob):
+        """Mark a job that never ran as cancelled and drop its input"""
+        job.status = CANCELLED
+        job.finished_at = datetime.now().isoformat()
+        if os.path.exists(job.input_path):
+            os.remove(job.input_path)
+
+    def _run(self, job: AnalysisJob):
+        """Worker thread body: stream the job input through the pipeline"""
+        if job.cancel_event.is_set():
+            self._finish_cancelled(job)
+            return
+
+        job.status = RUNNING
+        job.started_at = datetime.now().isoformat()
+
+        def progress(count: int, elapsed: float):
+            job.processed = count
+            if job.cancel_event.is_set():
+                raise JobCancelled()
+
+        try:
+            run_pipeline(job.input_path, job.output_path, self.tool, job.output_format,
+                         progress=progress, engine=job.engine)
+            self.tool.flush_caches()
+            job.status = COMPLETED
+        except JobCancelled:
+            job.status = CANCELLED
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            if os.path.exists(job.input_path):
+                os.remove(job.input_path)
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Dict]:
+        with self._lock:
+            return [job.to_dict() for job in reversed(list(self._jobs.values()))]
+
+    def cancel(self, job_id: str) -> Optional[AnalysisJob]:
+        """Cancel a queued job immediately or a running job after its current chunk"""
+        job = self.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return job
+
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self._finish_cancelled(job)
+        return job
+
+    def shutdown(self):
+        """Cancel everything and stop the worker threads"""
+        with self._lock:
+            job_ids = list(self._jobs)
+        for job_id in job_ids:
+            self.cancel(job_id)
+        self._executor.shutdown(wait=True)
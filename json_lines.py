@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Lines Output
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Compact one-record-per-line JSON output. Uses orjson when it is installed
+and falls back to the standard json module otherwise.
+"""
+
+import json
+import time
+from typing import Callable, Dict, IO, Iterable
+
+from lazy_imports import LazyModule, module_available
+
+# orjson is imported on first use
+ORJSON_AVAILABLE = module_available('orjson')
+orjson = LazyModule('orjson')
+
+def _json_dumps_line(record: Dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+def line_encoder() -> Callable[[Dict], str]:
+    """Return a function serializing one record as a compact JSON line
+
+    orjson.dumps is bound directly, so loops over many records call it
+    without going through the lazy module.
+    """
+    if not ORJSON_AVAILABLE:
+        return _json_dumps_line
+    dumps = orjson.dumps
+    return lambda record: dumps(record).decode('utf-8')
+
+def dumps_line(record: Dict) -> str:
+    """Serialize one record as a compact JSON line (without the newline)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record).decode('utf-8')
+    return _json_dumps_line(record)
+
+def write_lines(f: IO[str], records: Iterable[Dict], flush_every: int = 1000,
+                flush_interval: float = 1.0) -> int:
+    """Append records to f one line each as they are produced; returns the count
+
+    The file is flushed every flush_every records, or when a record arrives
+    flush_interval seconds after the last flush, so completed work reaches
+    disk while a long (or slow, simulated) run is still going.
+    """
+    encode = line_encoder()
+    count = 0
+    last_flush = time.monotonic()
+    for record in records:
+        f.write(encode(record))
+        f.write('\n')
+        count += 1
+        if count % flush_every == 0 or time.monotonic() - last_flush >= flush_interval:
+            f.flush()
+            last_flush = time.monotonic()
+    return count
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Deferred Module Imports
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Heavy optional libraries (phonenumbers data, requests, rich, pyarrow, ...)
+are only imported when first used, so one-shot CLI runs that never touch
+them start quickly.
+"""
+
+import importlib
+import importlib.util
+
+def module_available(name: str) -> bool:
+    """Return True if a top-level module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access"""
+
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            # import_module serializes concurrent first imports on the import lock
+            module = self._module = importlib.import_module(self._name)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-Prefix Metadata Cache
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Memoizes geocoder, carrier and timezone answers per metadata prefix.
+phonenumbers resolves all three by the longest prefix of the E.164 digits
+found in its prefix tables, so every number in the same allocation block
+gets the same answers. Those answers also depend on the number type, so
+the cache key is (calling code, type, longest matching prefix), and
+clustered exports hit it for nearly every number.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from lazy_imports import LazyModule
+
+phonenumbers = LazyModule('phonenumbers')
+geocoder = LazyModule('phonenumbers.geocoder')
+carrier = LazyModule('phonenumbers.carrier')
+timezone = LazyModule('phonenumbers.timezone')
+
+_prefix_tables = None
+_prefix_tables_lock = threading.Lock()
+
+def metadata_prefixes() -> Tuple[frozenset, int, frozenset]:
+    """Union of geocoder, carrier and timezone prefixes, the longest prefix
+    length, and the calling codes that use a mobile token
+
+    Built once on first use (a few hundred thousand keys).
+    """
+    global _prefix_tables
+    if _prefix_tables is None:
+        with _prefix_tables_lock:
+            if _prefix_tables is None:
+                prefixes = frozenset(geocoder.GEOCODE_DATA).union(carrier.CARRIER_DATA, timezone.TIMEZONE_DATA)
+                longest = max(geocoder.GEOCODE_LONGEST_PREFIX, carrier.CARRIER_LONGEST_PREFIX,
+                              timezone.TIMEZONE_LONGEST_PREFIX)
+                token_codes = frozenset(cc for cc in phonenumbers.COUNTRY_CODE_TO_REGION_CODE
+                                        if phonenumbers.country_mobile_token(cc))
+                _prefix_tables = (prefixes, longest, token_codes)
+    return _prefix_tables
+
+def _e164_digits(numobj) -> str:
+    """Calling code plus national significant number (E.164 without the +)"""
+    leading = '0' * (numobj.number_of_leading_zeros or 1) if numobj.italian_leading_zero else ''
+    return f"{numobj.country_code}{leading}{numobj.national_number}"
+
+class PrefixMetadataCache:
+    """Memoized English geocoder/carrier/timezone lookups keyed on the metadata prefix
+
+    The answer for a key never changes, so entries have no TTL. Once
+    max_size keys are stored the table is cleared and refilled.
+    Concurrent fills of the same key store equal values, so no lock is
+    needed around the table (the hit/miss counters are approximate under
+    threads).
+    """
+
+    def __init__(self, max_size: int = 100000):
+        self.max_size = max_size
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, numobj, ntype) -> Optional[tuple]:
+        prefixes, longest, token_codes = metadata_prefixes()
+        cc = numobj.country_code
+        if cc in token_codes:
+            # Geocoding strips a mobile token and re-parses, which is not prefix-determined
+            return None
+        digits = _e164_digits(numobj)
+        for length in range(min(longest, len(digits)), 0, -1):
+            prefix = digits[:length]
+            if prefix in prefixes:
+                break
+        else:
+            prefix = ''
+        return (cc, ntype, prefix)
+
+    def _shared_description(self, numobj, ntype) -> bool:
+        """Whether the geocoder description holds for every number with the same key
+
+        Descriptions from the prefix data do. The country-name fallback
+        does not when a calling code is shared by several regions (+1, +44,
+        +7, ...), because it depends on the regions the full number is
+        valid in.
+        """
+        cc = numobj.country_code
+        if ntype == phonenumbers.PhoneNumberType.UNKNOWN:
+            return True
+        if len(phonenumbers.region_codes_for_country_code(cc)) < 2:
+            return True
+        if not phonenumbers.is_number_type_geographical(ntype, cc):
+            return False
+        digits = _e164_digits(numobj)
+        for length in range(geocoder.GEOCODE_LONGEST_PREFIX, 0, -1):
+            names = geocoder.GEOCODE_DATA.get(digits[:length])
+            if names is not None and 'en' in names:
+                return names['en'] != ''
+        return False
+
+    def lookup(self, numobj, ntype) -> Tuple[str, str, tuple]:
+        """Return (geocoder description, carrier name, time zones) for a parsed number
+
+        ntype must be number_type(numobj); callers already have it.
+        """
+        key = self._key(numobj, ntype)
+        if key is not None:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self.hits += 1
+                description, carrier_name, zones = cached
+                if description is None:
+                    description = geocoder.country_name_for_number(numobj, "en")
+                return description, carrier_name, zones
+
+        self.misses += 1
+        answer = (
+            geocoder.description_for_number(numobj, "en"),
+            carrier.name_for_number(numobj, "en"),
+            tuple(timezone.time_zones_for_number(numobj))
+        )
+        if key is not None:
+            if len(self._entries) >= self.max_size:
+                self._entries.clear()
+            if self._shared_description(numobj, ntype):
+                self._entries[key] = answer
+            else:
+                # Keep carrier and time zones; the country name is looked up per number
+                self._entries[key] = (None,) + answer[1:]
+        return answer
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Return cache counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lightweight Metrics
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Counters, gauges and histograms with labels, rendered in the Prometheus
+text exposition format. Also provides per-stage timing for the analysis
+hot path, which costs one None check per stage when disabled.
+"""
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets in seconds, from microsecond stages up to slow simulated lookups
+DEFAULT_BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+                   0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Request latency buckets in seconds (simulated batches take minutes)
+REQUEST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# Numbers per request, up to the bulk endpoint limit
+SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+class Counter:
+    """Monotonically increasing value"""
+
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def set(self, value: float):
+        """Mirror a count kept elsewhere (e.g. cache stats) from a collector"""
+        self.value = value
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        return [f"{name}{labels} {_format(self.value)}"]
+
+class Gauge:
+    """Value that can go up and down"""
+
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        return [f"{name}{labels} {_format(self.value)}"]
+
+class Histogram:
+    """Bucketed distribution of observed values with count and sum"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum', '_lock')
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket that contains it"""
+        with self._lock:
+            counts, count = list(self.counts), self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return bound
+        return math.inf
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        with self._lock:
+            counts, count, total = list(self.counts), self.count, self.sum
+        lines = []
+        cumulative = 0
+        inner = labels[1:-1] + ',' if labels else ''
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{inner}le="{_format(bound)}"}} {cumulative}')
+        lines.append(f"{name}_sum{labels} {_format(total)}")
+        lines.append(f"{name}_count{labels} {count}")
+        return lines
+
+METRIC_TYPES = {
+    'counter': Counter,
+    'gauge': Gauge,
+    'histogram': Histogram
+}
+
+class MetricFamily:
+    """Named metric with one child series per label value combination"""
+
+    def __init__(self, kind: str, name: str, help_text: str, label_names: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.kind = kind
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """Return the series for these label values, creating it on first use"""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    if self.kind == 'histogram':
+                        child = Histogram(self.buckets)
+                    else:
+                        child = METRIC_TYPES[self.kind]()
+                    self._children[values] = child
+        return child
+
+    def children(self) -> Dict[tuple, object]:
+        with self._lock:
+            return dict(self._children)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self.children().items()):
+            labels = ','.join(f'{key}="{_escape(value)}"' for key, value in zip(self.label_names, values))
+            lines.extend(child.samples(self.name, f"{{{labels}}}" if labels else ''))
+        return lines
+
+class MetricsRegistry:
+    """Collection of metric families plus callbacks evaluated at scrape time"""
+
+    def __init__(self):
+        self._families = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _family(self, kind: str, name: str, help_text: str, label_names: Iterable[str],
+                buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricFamily:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = MetricFamily(kind, name, help_text, tuple(label_names), buckets)
+            return family
+
+    def counter(self, name: str, help_text: str, label_names: Iterable[str] = ()) -> MetricFamily:
+        return self._family('counter', name, help_text, label_names)
+
+    def gauge(self, name: str, help_text: str, label_names: Iterable[str] = ()) -> MetricFamily:
+        return self._family('gauge', name, help_text, label_names)
+
+    def histogram(self, name: str, help_text: str, label_names: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricFamily:
+        return self._family('histogram', name, help_text, label_names, buckets)
+
+    def add_collector(self, collector: Callable[[], None]):
+        """Register a callback run before rendering (to refresh gauges from stats)"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            collector()
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+        lines = []
+        for family in families:
+            lines.extend(family.render())
+        return '\n'.join(lines) + '\n'
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+# Process-wide registry (like the default registry of prometheus_client)
+REGISTRY = MetricsRegistry()
+
+class StageClock:
+    """Times consecutive stages of one analysis"""
+
+    __slots__ = ('timings', 'start', 'last')
+
+    def __init__(self, timings: 'StageTimings'):
+        self.timings = timings
+        self.start = self.last = time.perf_counter()
+
+    def lap(self, stage: str):
+        """Record the time since the previous lap under stage"""
+        now = time.perf_counter()
+        self.timings.observe(stage, now - self.last)
+        self.last = now
+
+    def finish(self, stage: str = 'total'):
+        """Record the whole analysis under stage ('total' by default)"""
+        self.timings.observe(stage, time.perf_counter() - self.start)
+
+class StageTimings:
+    """Per-stage duration histograms for the analysis hot path
+
+    Call start() per analysis; it returns None when disabled, so
+    instrumented code only pays for `if clock:` checks.
+    """
+
+    def __init__(self, enabled: bool = False, registry: MetricsRegistry = REGISTRY):
+        self.enabled = enabled
+        self.family = registry.histogram(
+            'phone_lookup_stage_seconds', 'Time spent in each analysis stage', ('stage',)
+        )
+
+    def start(self) -> Optional[StageClock]:
+        return StageClock(self) if self.enabled else None
+
+    def observe(self, stage: str, seconds: float):
+        self.family.labels(stage).observe(seconds)
+
+    def summary(self) -> Dict:
+        """Per-stage count, total, mean and bucketed p50/p99 in milliseconds"""
+        summary = {}
+        for (stage,), histogram in sorted(self.family.children().items()):
+            if not histogram.count:
+                continue
+            summary[stage] = {
+                'count': histogram.count,
+                'total_ms': round(histogram.sum * 1000, 3),
+                'mean_ms': round(histogram.sum * 1000 / histogram.count, 4),
+                'p50_ms': histogram.quantile(0.5) * 1000,
+                'p99_ms': histogram.quantile(0.99) * 1000
+            }
+        return summary
+
+    def log_summary(self, logger):
+        """Emit the summary as one structured (JSON) log line"""
+        if self.enabled:
+            logger.info("stage_timings " + json.dumps(self.summary(), sort_keys=True))
@@ -10,31 +10,125 @@ It only searches publicly available information through legitimate APIs.
 Do not use for illegal activities or privacy violations.
 """
 
-import requests
 import json
 import re
 import os
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Union
 from urllib.parse import quote
 from config import (
     DEVELOPER_INFO, APP_SETTINGS, COUNTRY_CODES, USER_AGENTS,
     VALIDATION_RULES, ERROR_MESSAGES, SUCCESS_MESSAGES, DISCLAIMERS,
-    get_config, get_country_info, is_educational_mode, get_user_agent
+    ANALYSIS_ENGINES, OUTPUT_SETTINGS, get_config, get_country_info, is_educational_mode, get_user_agent
 )
+from prefix_trie import build_country_tries
+from json_lines import dumps_line
+from history_index import HistoryIndex
+from lazy_imports import LazyModule
+
+# Imported on first use to keep one-shot CLI startup fast
+requests = LazyModule('requests')
+
+# Longest-prefix-match tables built once at import
+COUNTRY_TRIE, MOBILE_PREFIX_TRIES, CARRIER_PREFIX_TRIES = build_country_tries(COUNTRY_CODES)
+
+# Normalization tables built once at import
+_SEPARATOR_CHARS = ''.join(c for c in VALIDATION_RULES['allowed_characters'] if c not in '+0123456789')
+_DELETE_SEPARATORS = str.maketrans('', '', _SEPARATOR_CHARS)
+_DELETE_DIGITS_PLUS = str.maketrans('', '', '+0123456789')
+_NON_DIGIT_PLUS = re.compile(r'[^+\d]')
+_NON_DIGIT = re.compile(r'[^\d]')
+
+class NormalizedPhone(NamedTuple):
+    """A phone number cleaned, validated and formatted in a single pass"""
+    raw: str
+    clean: str
+    formatted: str
+    is_valid: bool
+    message: str
+
+def _format_clean(clean_phone: str) -> str:
+    """Format an already cleaned (digits and +) phone number"""
+    # If already has country code
+    if clean_phone.startswith('+'):
+        return clean_phone
+        
+    # Saudi Arabia specific formatting
+    if clean_phone.startswith('966'):
+        return f"+{clean_phone}"
+    elif clean_phone.startswith('05'):
+        return f"+966{clean_phone[1:]}"
+    elif clean_phone.startswith('5') and len(clean_phone) == 9:
+        return f"+966{clean_phone}"
+    elif clean_phone.startswith('0') and len(clean_phone) == 10:
+        # Assume Saudi if starts with 0 and 10 digits
+        return f"+966{clean_phone[1:]}"
+    else:
+        # Try to detect country code
+        if COUNTRY_TRIE.longest_match(clean_phone)[0]:
+            return f"+{clean_phone}"
+        
+        # Default: assume it needs +966 if no country code detected
+        return f"+966{clean_phone}"
+
+def normalize_phone(phone: str) -> NormalizedPhone:
+    """Clean, validate and format a phone number once for all later steps"""
+    # Fast path: only allowed separators, ASCII digits and '+'
+    clean_phone = phone.translate(_DELETE_SEPARATORS)
+    has_invalid_chars = bool(clean_phone.translate(_DELETE_DIGITS_PLUS))
+    
+    if has_invalid_chars:
+        # Rare path: keep the exact regex semantics (e.g. Unicode digits)
+        clean_phone = _NON_DIGIT_PLUS.sub('', phone)
+        digit_count = len(_NON_DIGIT.sub('', clean_phone))
+    else:
+        digit_count = len(clean_phone) - clean_phone.count('+')
+    
+    formatted = _format_clean(clean_phone)
+    
+    if not phone:
+        return NormalizedPhone(phone, clean_phone, formatted, False, ERROR_MESSAGES['invalid_phone'])
+    
+    if digit_count < VALIDATION_RULES['min_phone_length'] or digit_count > VALIDATION_RULES['max_phone_length']:
+        return NormalizedPhone(phone, clean_phone, formatted, False,
+                               f"{ERROR_MESSAGES['invalid_phone']} (Length: {digit_count})")
+    
+    if has_invalid_chars:
+        return NormalizedPhone(phone, clean_phone, formatted, False,
+                               f"{ERROR_MESSAGES['invalid_phone']} (Invalid characters)")
+    
+    return NormalizedPhone(phone, clean_phone, formatted, True, SUCCESS_MESSAGES['validation_passed'])
 
 class PhoneLookupTool:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': get_user_agent()
-        })
+    def __init__(self, engine: str = None):
+        self.engine = engine or get_config('analysis')['engine']
+        if self.engine not in ANALYSIS_ENGINES:
+            raise ValueError(f"Unknown analysis engine: {self.engine}")
+        self._session = None
+        self._history = None
         self.setup_logging()
         self.results_dir = get_config('output')['output_directory']
         self.ensure_results_directory()
         
+    @property
+    def session(self) -> 'requests.Session':
+        """HTTP session (created on first use)"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': get_user_agent()
+            })
+        return self._session
+    
+    @property
+    def history(self) -> HistoryIndex:
+        """Index of saved result files (opened on first use)"""
+        if self._history is None:
+            self._history = HistoryIndex(os.path.join(self.results_dir, 'history_index.db'))
+        return self._history
+    
     def setup_logging(self):
         """Setup logging configuration"""
         log_config = get_config('logging')
@@ -55,66 +149,22 @@ class PhoneLookupTool:
             
     def validate_phone_number(self, phone: str) -> tuple[bool, str]:
         """Enhanced phone number validation"""
-        if not phone:
-            return False, ERROR_MESSAGES['invalid_phone']
-            
-        # Remove all non-digit characters except +
-        clean_phone = re.sub(r'[^+\d]', '', phone)
-        
-        # Check length
-        digit_count = len(re.sub(r'[^\d]', '', clean_phone))
-        if digit_count < VALIDATION_RULES['min_phone_length'] or digit_count > VALIDATION_RULES['max_phone_length']:
-            return False, f"{ERROR_MESSAGES['invalid_phone']} (Length: {digit_count})"
-            
-        # Check for valid characters
-        allowed_chars = set(VALIDATION_RULES['allowed_characters'])
-        if not all(c in allowed_chars for c in phone):
-            return False, f"{ERROR_MESSAGES['invalid_phone']} (Invalid characters)"
-            
-        return True, SUCCESS_MESSAGES['validation_passed']
+        normalized = normalize_phone(phone)
+        return normalized.is_valid, normalized.message
     
     def format_phone_number(self, phone: str) -> str:
         """Enhanced phone number formatting"""
-        # Remove all non-digit characters except +
-        clean_phone = re.sub(r'[^+\d]', '', phone)
-        
-        # If already has country code
-        if clean_phone.startswith('+'):
-            return clean_phone
-            
-        # Saudi Arabia specific formatting
-        if clean_phone.startswith('966'):
-            return f"+{clean_phone}"
-        elif clean_phone.startswith('05'):
-            return f"+966{clean_phone[1:]}"
-        elif clean_phone.startswith('5') and len(clean_phone) == 9:
-            return f"+966{clean_phone}"
-        elif clean_phone.startswith('0') and len(clean_phone) == 10:
-            # Assume Saudi if starts with 0 and 10 digits
-            return f"+966{clean_phone[1:]}"
-        else:
-            # Try to detect country code
-            for code in COUNTRY_CODES.keys():
-                code_digits = code[1:]  # Remove +
-                if clean_phone.startswith(code_digits):
-                    return f"+{clean_phone}"
-            
-            # Default: assume it needs +966 if no country code detected
-            return f"+966{clean_phone}"
+        return normalize_phone(phone).formatted
     
-    def detect_country_and_carrier(self, phone: str) -> Dict:
+    def detect_country_and_carrier(self, phone: Union[str, NormalizedPhone]) -> Dict:
         """Detect country and carrier information"""
-        formatted_phone = self.format_phone_number(phone)
+        if not isinstance(phone, NormalizedPhone):
+            phone = normalize_phone(phone)
+        formatted_phone = phone.formatted
         
-        # Find matching country code
-        country_info = None
-        detected_code = None
-        
-        for code, info in COUNTRY_CODES.items():
-            if formatted_phone.startswith(code):
-                country_info = info
-                detected_code = code
-                break
+        # Find matching country code (longest prefix wins, e.g. +1 vs +1xxx)
+        detected_code, code_length = COUNTRY_TRIE.longest_match(formatted_phone, 1)
+        country_info = COUNTRY_CODES.get(detected_code)
         
         if not country_info:
             return {
@@ -126,29 +176,16 @@ class PhoneLookupTool:
                 'is_mobile': False
             }
         
-        # Extract number after country code
-        number_part = formatted_phone[len(detected_code):]
+        # Number after country code starts right after the '+' and code digits
+        number_start = code_length + 1
         
         # Check if it's mobile based on prefixes
-        is_mobile = False
+        is_mobile = MOBILE_PREFIX_TRIES[detected_code].longest_match(formatted_phone, number_start)[0] is not None
         detected_carrier = 'Unknown'
         
-        if country_info['mobile_prefixes']:
-            for prefix in country_info['mobile_prefixes']:
-                if number_part.startswith(prefix):
-                    is_mobile = True
-                    break
-        
-        # Saudi Arabia specific carrier detection
-        if detected_code == '+966' and is_mobile:
-            if number_part.startswith('50') or number_part.startswith('53') or number_part.startswith('56'):
-                detected_carrier = 'STC'
-            elif number_part.startswith('51') or number_part.startswith('54') or number_part.startswith('57'):
-                detected_carrier = 'Mobily'
-            elif number_part.startswith('52') or number_part.startswith('55') or number_part.startswith('58'):
-                detected_carrier = 'Zain'
-            elif number_part.startswith('59'):
-                detected_carrier = 'Virgin Mobile'
+        # Carrier detection from configured number ranges
+        if is_mobile:
+            detected_carrier = CARRIER_PREFIX_TRIES[detected_code].longest_match(formatted_phone, number_start)[0] or 'Unknown'
         
         return {
             'country_code': detected_code,
@@ -160,13 +197,16 @@ class PhoneLookupTool:
             'available_carriers': country_info['carriers']
         }
     
-    def educational_lookup(self, phone: str) -> Dict:
+    def educational_lookup(self, phone: Union[str, NormalizedPhone]) -> Dict:
         """Educational lookup simulation"""
-        formatted_phone = self.format_phone_number(phone)
-        country_carrier_info = self.detect_country_and_carrier(formatted_phone)
+        if not isinstance(phone, NormalizedPhone):
+            phone = normalize_phone(phone)
+        formatted_phone = phone.formatted
+        country_carrier_info = self.detect_country_and_carrier(phone)
         
-        # Simulate lookup delay
-        time.sleep(1)
+        # Simulate lookup delay (skipped by the fast engine)
+        if self.engine != 'fast':
+            time.sleep(1)
         
         result = {
             'phone_number': formatted_phone,
@@ -199,43 +239,62 @@ class PhoneLookupTool:
     
     def perform_lookup(self, phone: str) -> Dict:
         """Main lookup function"""
-        self.logger.info(f"Starting lookup for phone: {phone}")
-        
-        # Validate phone number
-        is_valid, validation_message = self.validate_phone_number(phone)
-        if not is_valid:
-            self.logger.error(f"Validation failed: {validation_message}")
-            return {'error': validation_message}
+        # Per-lookup progress lines are debug-only in fast mode to keep the hot path cheap
+        log_progress = self.logger.debug if self.engine == 'fast' else self.logger.info
+        log_progress(f"Starting lookup for phone: {phone}")
         
-        formatted_phone = self.format_phone_number(phone)
+        # Clean, validate and format once; later steps reuse the result
+        normalized = normalize_phone(phone)
+        if not normalized.is_valid:
+            self.logger.error(f"Validation failed: {normalized.message}")
+            return {'error': normalized.message}
         
         try:
             if is_educational_mode():
-                result = self.educational_lookup(formatted_phone)
-                self.logger.info("Educational lookup completed")
+                result = self.educational_lookup(normalized)
+                log_progress("Educational lookup completed")
                 return result
             else:
                 # Real API lookup would go here
                 self.logger.warning("Real API mode not implemented - using educational mode")
-                return self.educational_lookup(formatted_phone)
+                return self.educational_lookup(normalized)
                 
         except Exception as e:
             self.logger.error(f"Lookup error: {str(e)}")
             return {'error': f"{ERROR_MESSAGES['api_error']}: {str(e)}"}
     
     def save_results(self, results: Dict, phone: str) -> str:
-        """Save results to file"""
+        """Save results to file
+        
+        With OUTPUT_SETTINGS['output_format'] == 'jsonl' each lookup is
+        appended as one compact line to a daily lookup_results_<date>.jsonl.
+        """
         if 'error' in results:
             return None
+        
+        if OUTPUT_SETTINGS['output_format'] == 'jsonl':
+            filepath = os.path.join(self.results_dir, f"lookup_results_{datetime.now().strftime('%Y%m%d')}.jsonl")
+            try:
+                with open(filepath, 'a', encoding='utf-8') as f:
+                    f.write(dumps_line(results) + '\n')
+                self.history.append(os.path.basename(filepath), time.time(), 1,
+                                    [results['country_info'].get('country_code', 'Unknown')])
+                self.logger.info(f"Results appended to {filepath}")
+                return filepath
+            except Exception as e:
+                self.logger.error(f"Failed to save results: {str(e)}")
+                return None
             
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        clean_phone = re.sub(r'[^\d]', '', phone)
+        clean_phone = _NON_DIGIT.sub('', phone)
         filename = f"lookup_{clean_phone}_{timestamp}.json"
         filepath = os.path.join(self.results_dir, filename)
         
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(results, f, indent=2, ensure_ascii=False)
+            self.history.add(filename, time.time(), 1,
+                             [results['country_info'].get('country_code', 'Unknown')])
             self.logger.info(f"Results saved to {filepath}")
             return filepath
         except Exception as e:
@@ -321,9 +380,19 @@ def print_banner():
 
 def main():
     """Main application function"""
+    import argparse
+    from contextlib import nullcontext
+    from profiling import add_profile_arguments, profiler_from_args
+    
+    parser = argparse.ArgumentParser(description='Phone Lookup Tool')
+    parser.add_argument('--engine', choices=ANALYSIS_ENGINES, default=get_config('analysis')['engine'],
+                        help=f"Analysis engine (default: {get_config('analysis')['engine']})")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    
     print_banner()
     
-    lookup_tool = PhoneLookupTool()
+    lookup_tool = PhoneLookupTool(engine=args.engine)
     
     print("\n📋 Instructions:")
     print("• Enter a phone number to lookup")
@@ -331,55 +400,56 @@ def main():
     print("• Type 'quit', 'exit', or 'q' to exit")
     print("• Type 'help' for more information\n")
     
-    while True:
-        try:
-            user_input = input("🔍 Enter phone number: ").strip()
-            
-            if user_input.lower() in ['quit', 'exit', 'q']:
-                print("\n👋 Thank you for using Phone Lookup Tool!")
-                print(f"Developed by {DEVELOPER_INFO['name']} - {DEVELOPER_INFO['email']}")
+    with profiler_from_args(args) or nullcontext():
+        while True:
+            try:
+                user_input = input("🔍 Enter phone number: ").strip()
+                
+                if user_input.lower() in ['quit', 'exit', 'q']:
+                    print("\n👋 Thank you for using Phone Lookup Tool!")
+                    print(f"Developed by {DEVELOPER_INFO['name']} - {DEVELOPER_INFO['email']}")
+                    break
+                
+                if user_input.lower() == 'help':
+                    print("\n📖 Help Information:")
+                    print("• This tool searches for publicly available information only")
+                    print("• All searches are logged for educational purposes")
+                    print("• Results are saved in the 'results' directory")
+                    print("• Respect privacy and use responsibly")
+                    print("• Contact developer for questions or support\n")
+                    continue
+                
+                if not user_input:
+                    print("❌ Please enter a valid phone number.\n")
+                    continue
+                
+                print("\n🔄 Processing lookup...")
+                
+                # Perform lookup
+                results = lookup_tool.perform_lookup(user_input)
+                
+                # Display results
+                lookup_tool.display_results(results)
+                
+                # Ask to save results
+                if 'error' not in results:
+                    save_choice = input("\n💾 Save results to file? (y/n): ").strip().lower()
+                    if save_choice in ['y', 'yes']:
+                        saved_file = lookup_tool.save_results(results, user_input)
+                        if saved_file:
+                            print(f"✅ Results saved to: {saved_file}")
+                        else:
+                            print("❌ Failed to save results")
+                
+                print("\n" + "-"*60 + "\n")
+                
+            except KeyboardInterrupt:
+                print("\n\n⏹️  Operation cancelled by user")
+                print("👋 Goodbye!")
                 break
-            
-            if user_input.lower() == 'help':
-                print("\n📖 Help Information:")
-                print("• This tool searches for publicly available information only")
-                print("• All searches are logged for educational purposes")
-                print("• Results are saved in the 'results' directory")
-                print("• Respect privacy and use responsibly")
-                print("• Contact developer for questions or support\n")
-                continue
-            
-            if not user_input:
-                print("❌ Please enter a valid phone number.\n")
-                continue
-            
-            print("\n🔄 Processing lookup...")
-            
-            # Perform lookup
-            results = lookup_tool.perform_lookup(user_input)
-            
-            # Display results
-            lookup_tool.display_results(results)
-            
-            # Ask to save results
-            if 'error' not in results:
-                save_choice = input("\n💾 Save results to file? (y/n): ").strip().lower()
-                if save_choice in ['y', 'yes']:
-                    saved_file = lookup_tool.save_results(results, user_input)
-                    if saved_file:
-                        print(f"✅ Results saved to: {saved_file}")
-                    else:
-                        print("❌ Failed to save results")
-            
-            print("\n" + "-"*60 + "\n")
-            
-        except KeyboardInterrupt:
-            print("\n\n⏹️  Operation cancelled by user")
-            print("👋 Goodbye!")
-            break
-        except Exception as e:
-            print(f"\n❌ An unexpected error occurred: {str(e)}")
-            print("Please try again or contact support.\n")
+            except Exception as e:
+                print(f"\n❌ An unexpected error occurred: {str(e)}")
+                print("Please try again or contact support.\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
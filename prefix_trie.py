@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Digit Prefix Trie
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Longest-prefix-match lookups over digit strings (country codes, mobile
+prefixes, carrier number ranges) in O(number of digits).
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Key under which a node stores its value (never a digit, so no clash with children)
+_VALUE = None
+
+class PrefixTrie:
+    """Trie of digit prefixes supporting longest-prefix matching"""
+
+    __slots__ = ('root', 'size')
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()):
+        self.root = {}
+        self.size = 0
+        for prefix, value in items:
+            self.insert(prefix, value)
+
+    def insert(self, prefix: str, value: Any):
+        """Map prefix to value (a later insert of the same prefix replaces it)"""
+        node = self.root
+        for digit in prefix:
+            node = node.setdefault(digit, {})
+        if _VALUE not in node:
+            self.size += 1
+        node[_VALUE] = value
+
+    def longest_match(self, text: str, start: int = 0) -> Tuple[Optional[Any], int]:
+        """Return (value, prefix length) of the longest prefix of text[start:]
+
+        Returns (None, 0) when no stored prefix matches.
+        """
+        node = self.root
+        value, length = None, 0
+        for i in range(start, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if _VALUE in node:
+                value, length = node[_VALUE], i - start + 1
+        return value, length
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, prefix: str) -> bool:
+        node = self.root
+        for digit in prefix:
+            node = node.get(digit)
+            if node is None:
+                return False
+        return _VALUE in node
+
+def build_country_tries(country_codes: Dict) -> Tuple[PrefixTrie, Dict[str, PrefixTrie], Dict[str, PrefixTrie]]:
+    """Build the country code, mobile prefix and carrier range tries from COUNTRY_CODES"""
+    country_trie = PrefixTrie((code.lstrip('+'), code) for code in country_codes)
+    mobile_tries = {}
+    carrier_tries = {}
+    for code, info in country_codes.items():
+        mobile_tries[code] = PrefixTrie((prefix, True) for prefix in info.get('mobile_prefixes', []))
+        carrier_tries[code] = PrefixTrie(info.get('carrier_prefixes', {}).items())
+    return country_trie, mobile_tries, carrier_tries
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Built-in Profiling
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+Runs a CLI mode under a profiler and writes flame-graph-compatible output
+plus a top-N hotspot summary:
+
+    sample    wall-clock stack sampling of every thread. Writes
+              <prefix>.collapsed (folded stacks for flamegraph.pl,
+              speedscope or inferno) and <prefix>.txt.
+    cprofile  deterministic cProfile of the main thread with exact call
+              counts. Writes <prefix>.prof (snakeviz, flameprof) and
+              <prefix>.txt.
+
+Process-pool workers (--workers > 1) run in other processes and are not
+profiled.
+"""
+
+import os
+import sys
+import time
+import queue
+import cProfile
+import pstats
+import threading
+import logging.handlers
+from collections import Counter
+from datetime import datetime
+
+PROFILE_MODES = ('sample', 'cprofile')
+
+# Threads whose innermost frame is in these modules are idle (pool workers
+# waiting for tasks) and are left out of the samples
+IDLE_FILES = {threading.__file__, queue.__file__}
+
+# Innermost frames of idle threads blocked in C code, e.g. the logging
+# QueueListener waiting on a SimpleQueue
+IDLE_FRAMES = {(logging.handlers.__file__, 'dequeue')}
+
+def default_output_prefix(directory: str = 'results') -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(directory, f"profile_{timestamp}")
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class StackSampler:
+    """Sample the Python stacks of all threads from a background thread"""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                code = frame.f_code
+                if (thread_id == own_id or code.co_filename in IDLE_FILES
+                        or (code.co_filename, code.co_name) in IDLE_FRAMES):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, f"thread-{thread_id}"))
+                self.stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def write_collapsed(self, path: str):
+        """Write folded stacks: 'root;caller;callee count' per line"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def summary(self, top: int) -> str:
+        """Top functions by self and inclusive sample share"""
+        own = Counter()
+        total = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack[1:]):
+                total[label] += count
+
+        samples = self.samples or 1
+        lines = [f"Top {top} functions by self time "
+                 f"({self.samples} samples, {self.interval * 1000:g} ms interval, wall clock, all threads)",
+                 f"{'self %':>8s} {'total %':>8s}  function"]
+        for label, count in own.most_common(top):
+            lines.append(f"{count / samples:8.1%} {total[label] / samples:8.1%}  {label}")
+
+        lines += ["", f"Top {top} functions by total time", f"{'total %':>8s}  function"]
+        for label, count in total.most_common(top):
+            lines.append(f"{count / samples:8.1%}  {label}")
+        return '\n'.join(lines) + '\n'
+
+class Profiler:
+    """Context manager that profiles its body and writes the results on exit"""
+
+    def __init__(self, mode: str = 'sample', output_prefix: str = None, top: int = 25,
+                 interval: float = 0.001):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.output_prefix = output_prefix or default_output_prefix()
+        self.top = top
+        self.interval = interval
+        self._profiler = None
+        self._started = None
+
+    def __enter__(self):
+        if self.mode == 'sample':
+            self._profiler = StackSampler(self.interval)
+            self._profiler.start()
+        else:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._started
+        if self.mode == 'sample':
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+        directory = os.path.dirname(self.output_prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self.mode == 'sample':
+            graph_path = f"{self.output_prefix}.collapsed"
+            self._profiler.write_collapsed(graph_path)
+            summary = self._profiler.summary(self.top)
+        else:
+            graph_path = f"{self.output_prefix}.prof"
+            self._profiler.dump_stats(graph_path)
+            summary = self._cprofile_summary()
+
+        summary_path = f"{self.output_prefix}.txt"
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(summary)
+
+        print(f"\n⏱️ Profile ({self.mode}, {elapsed:.2f}s)\n")
+        print(summary)
+        print(f"📁 Flame graph data: {graph_path}")
+        print(f"📁 Hotspot summary: {summary_path}")
+        return False
+
+    def _cprofile_summary(self) -> str:
+        from io import StringIO
+
+        stream = StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream).strip_dirs()
+        stream.write(f"Top {self.top} functions by own time (main thread)\n")
+        stats.sort_stats('tottime').print_stats(self.top)
+        stream.write(f"Top {self.top} functions by cumulative time (main thread)\n")
+        stats.sort_stats('cumulative').print_stats(self.top)
+        return stream.getvalue()
+
+def add_profile_arguments(parser):
+    """Add --profile, --profile-mode, --profile-output and --profile-top to a CLI parser"""
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile the run and write flame graph data plus a hotspot summary')
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default='sample',
+                        help='sample (all threads, folded stacks) or cprofile (main thread, .prof) '
+                             '(default: sample)')
+    parser.add_argument('--profile-output', metavar='PREFIX',
+                        help='Profile output path prefix (default: results/profile_<timestamp>)')
+    parser.add_argument('--profile-top', type=int, default=25, metavar='N',
+                        help='Hotspots listed in the profile summary (default: 25)')
+
+def profiler_from_args(args):
+    """Return a Profiler for the parsed CLI arguments, or None without --profile"""
+    if not args.profile:
+        return None
+    return Profiler(args.profile_mode, args.profile_output, args.profile_top)
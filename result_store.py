@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact Result Store
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Columnar, interned storage for large numbers of analysis results. Only the
+summary fields are kept; full PhoneAnalysisResult objects are rebuilt on
+access, so memory per result is a small fraction of a dataclass with its
+additional_info dict.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterator
+
+from config import DISCLAIMERS
+
+_EPOCH = datetime(1970, 1, 1)
+
+class StringTable:
+    """Intern table mapping repeated strings (or tuples) to small integer ids"""
+
+    __slots__ = ('_ids', 'values')
+
+    def __init__(self):
+        self._ids = {}
+        self.values = []
+
+    def intern(self, value) -> int:
+        """Return the id for value, adding it on first sight"""
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+class CompactResultStore:
+    """Append-only sequence of analysis results stored as columns
+
+    Behaves like a list of PhoneAnalysisResult: len(), indexing and
+    iteration all work, with each result rebuilt lazily on access. The
+    verbose additional_info detail is not stored.
+    """
+
+    # Columns whose values repeat heavily and are stored as interned ids
+    INTERNED = ('country_code', 'country_name', 'region', 'carrier', 'line_type', 'timezone')
+
+    def __init__(self, result_type):
+        self.result_type = result_type  # class used to rebuild results (PhoneAnalysisResult)
+        self.phone_numbers = []
+        self.formatted_numbers = []
+        self.tables = {name: StringTable() for name in self.INTERNED}
+        self.ids = {name: array('I') for name in self.INTERNED}
+        self.is_valid = array('b')
+        self.is_possible = array('b')
+        self.confidence = array('d')
+        self.timestamps = array('q')  # microseconds since the epoch
+        self.errors = {}  # row index -> error message for failed analyses
+
+    def append(self, result):
+        """Add one PhoneAnalysisResult"""
+        index = len(self.phone_numbers)
+        self.phone_numbers.append(result.phone_number)
+        self.formatted_numbers.append(result.formatted_number)
+
+        for name in self.INTERNED:
+            value = getattr(result, name)
+            if name == 'timezone':
+                value = tuple(value)
+            self.ids[name].append(self.tables[name].intern(value))
+
+        self.is_valid.append(1 if result.is_valid else 0)
+        self.is_possible.append(1 if result.is_possible else 0)
+        self.confidence.append(result.confidence_score)
+
+        delta = datetime.fromisoformat(result.analysis_timestamp) - _EPOCH
+        self.timestamps.append((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+        error = result.additional_info.get("error")
+        if error:
+            self.errors[index] = error
+
+    def extend(self, results):
+        """Add many PhoneAnalysisResult objects"""
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return len(self.phone_numbers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        values = {name: self.tables[name].values[self.ids[name][index]] for name in self.INTERNED}
+        error = self.errors.get(index)
+
+        return self.result_type(
+            phone_number=self.phone_numbers[index],
+            formatted_number=self.formatted_numbers[index],
+            country_code=values['country_code'],
+            country_name=values['country_name'],
+            region=values['region'],
+            carrier=values['carrier'],
+            line_type=values['line_type'],
+            timezone=list(values['timezone']),
+            is_valid=bool(self.is_valid[index]),
+            is_possible=bool(self.is_possible[index]),
+            analysis_timestamp=(_EPOCH + timedelta(microseconds=self.timestamps[index])).isoformat(),
+            confidence_score=self.confidence[index],
+            additional_info={"error": error} if error else {},
+            educational_note=DISCLAIMERS['educational_use']
+        )
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self)):
+            yield self[index]
+
+    def stats(self) -> Dict:
+        """Return row count and distinct value counts per interned column"""
+        return {
+            'rows': len(self),
+            'distinct': {name: len(table) for name, table in self.tables.items()}
+        }
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Buffered Result Persistence
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Keeps disk I/O off the request path. Results are buffered in memory and a
+background thread writes them out, either appended to a daily JSON Lines
+log or rolled up into one results file per interval.
+"""
+
+import os
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict
+
+from json_lines import write_lines
+
+# Persistence policies for single analyses
+PERSISTENCE_POLICIES = ('none', 'log', 'rollup', 'file')
+
+class ResultWriter:
+    """Buffer analysis results and persist them from a background flusher
+
+    Policies:
+        none   - results are not persisted
+        log    - appended to results/analyze_log_YYYYMMDD.jsonl
+        rollup - written as one advanced_analysis_rollup_*.json per interval
+        file   - one results file per call (synchronous, legacy behaviour)
+    """
+
+    def __init__(self, tool, policy: str = 'rollup', interval: float = 60, max_buffer: int = 1000):
+        if policy not in PERSISTENCE_POLICIES:
+            raise ValueError(f"Unknown persistence policy: {policy} (use {', '.join(PERSISTENCE_POLICIES)})")
+        self.tool = tool
+        self.policy = policy
+        self.interval = interval
+        self.max_buffer = max_buffer
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self.written = 0
+
+    def submit(self, result):
+        """Queue one PhoneAnalysisResult for persistence"""
+        if self.policy == 'none':
+            return
+        if self.policy == 'file':
+            self.tool.save_results([result])
+            self.written += 1
+            return
+
+        with self._lock:
+            self._buffer.append(result)
+            full = len(self._buffer) >= self.max_buffer
+            if self._thread is None:
+                # Started lazily so importing never spawns threads (e.g. before a fork)
+                self._thread = threading.Thread(target=self._flush_loop, name='result-writer', daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def _flush_loop(self):
+        """Background thread: flush every interval or when the buffer fills up"""
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.tool.logger.error(f"Failed to persist results: {str(e)}")
+
+    def flush(self):
+        """Write out everything buffered so far"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._buffer = self._buffer, []
+            if not pending:
+                return
+
+            if self.policy == 'log':
+                filepath = os.path.join(self.tool.results_dir, f"analyze_log_{datetime.now().strftime('%Y%m%d')}.jsonl")
+                with open(filepath, 'a', encoding='utf-8') as f:
+                    write_lines(f, (asdict(result) for result in pending))
+                self.tool.index_result_file(filepath, len(pending),
+                                           {result.country_code for result in pending}, appended=True)
+            else:
+                filename = f"advanced_analysis_rollup_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
+                self.tool.save_results(pending, filename)
+
+            self.written += len(pending)
+
+    def close(self):
+        """Stop the flusher thread and write any remaining results"""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def stats(self) -> Dict:
+        """Return policy and counters"""
+        with self._lock:
+            return {
+                'policy': self.policy,
+                'interval': self.interval,
+                'buffered': len(self._buffer),
+                'written': self.written
+            }
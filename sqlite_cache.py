@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent SQLite Result Cache
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+On-disk cache of per-number analysis results shared between runs and
+processes. Uses WAL mode so readers never block the writer, and buffers
+inserts so they are committed in batches.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    cache_key TEXT PRIMARY KEY,
+    e164 TEXT NOT NULL,
+    formatted_number TEXT NOT NULL,
+    country_code TEXT NOT NULL,
+    country_name TEXT NOT NULL,
+    region TEXT NOT NULL,
+    carrier TEXT NOT NULL,
+    line_type TEXT NOT NULL,
+    timezones TEXT NOT NULL,
+    is_valid INTEGER NOT NULL,
+    is_possible INTEGER NOT NULL,
+    confidence_score REAL NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+FIELDS = ('e164', 'formatted_number', 'country_code', 'country_name', 'region', 'carrier',
+          'line_type', 'timezones', 'is_valid', 'is_possible', 'confidence_score')
+
+class SQLiteResultCache:
+    """Thread- and process-safe persistent cache backed by SQLite in WAL mode"""
+
+    def __init__(self, db_file: str, ttl: float = 3600, batch_size: int = 500):
+        self.db_file = db_file
+        self.ttl = ttl  # seconds, 0 or None disables expiry
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        conn = self._connection()
+        conn.execute(SCHEMA)
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached record for key, or None on a miss"""
+        with self._lock:
+            record = self._pending.get(key)
+        if record is None:
+            row = self._connection().execute(
+                f"SELECT {', '.join(FIELDS)}, created_at FROM analysis_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is not None and not (self.ttl and time.time() - row[-1] > self.ttl):
+                record = dict(zip(FIELDS, row))
+                record['timezones'] = json.loads(record['timezones'])
+                record['is_valid'] = bool(record['is_valid'])
+                record['is_possible'] = bool(record['is_possible'])
+
+        with self._lock:
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return record
+
+    def put(self, key: str, record: Dict):
+        """Queue a record for insertion; writes are committed in batches"""
+        with self._lock:
+            self._pending[key] = record
+            should_flush = len(self._pending) >= self.batch_size
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Commit all queued records in a single transaction"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        now = time.time()
+        rows = [
+            (key, *(json.dumps(record[f]) if f == 'timezones' else record[f] for f in FIELDS), now)
+            for key, record in pending.items()
+        ]
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO analysis_cache (cache_key, {', '.join(FIELDS)}, created_at) "
+                f"VALUES ({', '.join('?' * (len(FIELDS) + 2))})",
+                rows
+            )
+        with self._lock:
+            self.writes += len(rows)
+
+    def close(self):
+        """Flush pending writes and close this thread's connection"""
+        self.flush()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def stats(self) -> Dict:
+        """Return cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'db_file': self.db_file,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'pending': len(self._pending),
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming File Analysis Pipeline
+Developer: Saudi Linux
+Email: SaudiLinux7@gmail.com
+
+⚠️ FOR EDUCATIONAL PURPOSES ONLY ⚠️
+Reader -> analyzer -> writer generator pipeline. Numbers are read, analyzed
+and written chunk by chunk, so memory use does not grow with the input file.
+
+The fast engine writes the batch engine columns (e164, ISO region code,
+type, validity, time zones). Other engines write full results with the
+same fields as save_results (JSON Lines, Parquet, Arrow) or export_to_csv
+(CSV).
+"""
+
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from batch_engine import COLUMNS, BatchAnalysisEngine, chunked
+from columnar_export import COLUMNAR_FORMATS, COLUMNAR_WRITERS, result_schema, results_to_batch
+from csv_export import ResultCSVWriter
+from json_lines import line_encoder, write_lines
+
+# Output formats supported by the writers (parquet/arrow need pyarrow)
+STREAM_FORMATS = ('jsonl', 'csv', 'parquet', 'arrow')
+
+# Chunk size used when streaming through the (slow) simulation engine
+SIMULATION_CHUNK_SIZE = 50
+
+# Simulated lookups sleep, so a few run at once (as in batch_analysis)
+SIMULATION_THREADS = 3
+
+def read_numbers(path: str) -> Iterator[str]:
+    """Yield one stripped, non-empty phone number per input line"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+def _analyze(tool, engine: str, number: str):
+    """Analyze one number; failures become an error result so rows stay aligned with the input"""
+    try:
+        return tool.comprehensive_analysis(number, engine)
+    except Exception as e:
+        tool.logger.error(f"Error analyzing {number}: {str(e)}")
+        return tool._invalid_result(number, f"Analysis failed: {str(e)}")
+
+def analyze_results(numbers: Iterable[str], tool, engine: str) -> Iterator[List]:
+    """Yield lists of full PhoneAnalysisResult objects, in input order
+
+    At most SIMULATION_CHUNK_SIZE analyses are submitted at a time, run on
+    SIMULATION_THREADS threads.
+    """
+    analyze = partial(_analyze, tool, engine)
+    with ThreadPoolExecutor(max_workers=SIMULATION_THREADS) as executor:
+        for chunk in chunked(numbers, SIMULATION_CHUNK_SIZE):
+            yield list(executor.map(analyze, chunk))
+
+def analyze_stream(numbers: Iterable[str], tool, engine: str = None) -> Iterator:
+    """Yield analyzed chunks using the tool's engine and worker settings
+
+    Chunks are batch engine column dicts for the fast engine and lists of
+    PhoneAnalysisResult objects otherwise.
+    """
+    engine = engine or tool.engine
+    if engine == 'fast':
+        yield from BatchAnalysisEngine(workers=tool.workers, stage_timings=tool.stage_timings).iter_chunks(numbers)
+    else:
+        yield from analyze_results(numbers, tool, engine)
+
+def column_countries(columns: Dict) -> set:
+    """Calling codes in a column chunk as "+966" strings (unparsable numbers skipped)"""
+    return {f"+{cc}" for cc in set(columns['country_code']) if cc}
+
+def _rows(columns: Dict) -> Iterator[tuple]:
+    """Iterate over the rows of one column chunk"""
+    return zip(*(columns[name] for name in COLUMNS))
+
+class JSONLinesWriter:
+    """Write one compact JSON object per analyzed number"""
+
+    binary = False
+
+    def __init__(self, f):
+        self.f = f
+
+    def write_chunk(self, columns: Dict):
+        encode = line_encoder()
+        lines = []
+        for row in _rows(columns):
+            record = dict(zip(COLUMNS, row))
+            record['is_valid'] = bool(record['is_valid'])
+            record['timezones'] = list(record['timezones'])
+            lines.append(encode(record))
+        lines.append('')
+        self.f.write('\n'.join(lines))
+
+    def close(self):
+        pass
+
+class CSVWriter:
+    """Write analyzed numbers as CSV rows with a header line"""
+
+    binary = False
+
+    def __init__(self, f):
+        self.writer = csv.writer(f)
+        self.writer.writerow(COLUMNS)
+
+    def write_chunk(self, columns: Dict):
+        timezone_index = COLUMNS.index('timezones')
+        valid_index = COLUMNS.index('is_valid')
+        for row in _rows(columns):
+            row = list(row)
+            row[timezone_index] = ', '.join(row[timezone_index])
+            row[valid_index] = bool(row[valid_index])
+            self.writer.writerow(row)
+
+    def close(self):
+        pass
+
+class ResultJSONLinesWriter:
+    """Write full results as JSON Lines records (the save_results layout)"""
+
+    binary = False
+
+    def __init__(self, f):
+        self.f = f
+
+    def write_chunk(self, results: List):
+        write_lines(self.f, (asdict(result) for result in results))
+
+    def close(self):
+        pass
+
+class ResultColumnarWriter:
+    """Write full results as Parquet row groups or Arrow record batches"""
+
+    binary = True
+
+    def __init__(self, f, output_format: str):
+        self.schema = result_schema()
+        self.writer = COLUMNAR_WRITERS[output_format](f, self.schema)
+
+    def write_chunk(self, results: List):
+        self.writer.write_batch(results_to_batch(results, self.schema))
+
+    def close(self):
+        self.writer.close()
+
+# Writers for batch engine column chunks (fast engine)
+STREAM_WRITERS = {
+    'jsonl': JSONLinesWriter,
+    'csv': CSVWriter,
+    **COLUMNAR_WRITERS
+}
+
+# Writers for lists of full results (other engines)
+RESULT_WRITERS = {
+    'jsonl': ResultJSONLinesWriter,
+    'csv': ResultCSVWriter,
+    **{name: partial(ResultColumnarWriter, output_format=name) for name in COLUMNAR_FORMATS}
+}
+
+def run_pipeline(input_path: str, output_path: str, tool, output_format: str = None,
+                 progress: Optional[Callable[[int, float], None]] = None, engine: str = None,
+                 countries: Optional[set] = None) -> int:
+    """Stream input_path through the analyzer into output_path
+
+    output_format defaults to the output file extension (jsonl, csv,
+    parquet or arrow).
+    progress, when given, is called after every chunk with the number of
+    numbers processed so far and the elapsed seconds; raising from it stops
+    the pipeline. engine overrides tool.engine. countries, when given, is
+    updated with the calling codes seen ("+966"). Returns the total count.
+    """
+    output_format = output_format or output_path.rsplit('.', 1)[-1].lower()
+    if output_format not in STREAM_WRITERS:
+        raise ValueError(f"Unsupported stream format: {output_format} (use {', '.join(STREAM_FORMATS)})")
+
+    engine = engine or tool.engine
+    fast = engine == 'fast'
+    total = 0
+    start = time.perf_counter()
+
+    if output_format in COLUMNAR_FORMATS:
+        f = open(output_path, 'wb')
+    else:
+        f = open(output_path, 'w', encoding='utf-8', newline='')
+
+    with f:
+        writer = (STREAM_WRITERS if fast else RESULT_WRITERS)[output_format](f)
+        for chunk in analyze_stream(read_numbers(input_path), tool, engine):
+            writer.write_chunk(chunk)
+            if fast:
+                total += len(chunk['phone_number'])
+                if countries is not None:
+                    countries.update(column_countries(chunk))
+            else:
+                total += len(chunk)
+                if countries is not None:
+                    countries.update(result.country_code for result in chunk if result.country_code)
+            if progress:
+                progress(total, time.perf_counter() - start)
+        writer.close()
+
+    return total
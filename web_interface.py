@@ -10,16 +10,20 @@ This web interface provides a user-friendly way to access phone lookup functiona
 Do not use for illegal activities or privacy violations.
 """
 
+import io
 import os
 import sys
 import json
+import atexit
 import time
 import threading
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 try:
-    from flask import Flask, render_template_string, request, jsonify, send_file, redirect, url_for
+    from flask import Flask, Response, g, render_template_string, request, jsonify, send_file, redirect, url_for, stream_with_context
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
@@ -27,14 +31,22 @@ except ImportError:
     print("📦 Install with: pip install flask")
     sys.exit(1)
 
+from lazy_imports import module_available
+
+# uvicorn and a2wsgi are only imported when the ASGI server starts
+ASGI_AVAILABLE = module_available('uvicorn') and module_available('a2wsgi')
+
 try:
-    from config import DEVELOPER_INFO, APP_SETTINGS, DISCLAIMERS
+    from config import DEVELOPER_INFO, APP_SETTINGS, DISCLAIMERS, ANALYSIS_ENGINES, WEB_SETTINGS
 except ImportError:
     print("❌ Error: config.py not found")
     sys.exit(1)
 
 try:
     from advanced_lookup import AdvancedPhoneLookup
+    from job_queue import COMPLETED, JobManager, JobQueueFull
+    from result_writer import PERSISTENCE_POLICIES, ResultWriter
+    from metrics import REGISTRY, REQUEST_BUCKETS, SIZE_BUCKETS
 except ImportError:
     print("❌ Error: advanced_lookup.py not found")
     sys.exit(1)
@@ -46,6 +58,24 @@ app.secret_key = 'saudi_linux_phone_lookup_2024'
 # Initialize lookup tool
 lookup_tool = AdvancedPhoneLookup()
 
+# Off-request-path persistence for single analyses
+result_writer = ResultWriter(
+    lookup_tool,
+    policy=WEB_SETTINGS['analyze_persistence'],
+    interval=WEB_SETTINGS['persistence_interval'],
+    max_buffer=WEB_SETTINGS['persistence_max_buffer']
+)
+atexit.register(result_writer.close)
+
+# Background job manager for large batches
+job_manager = JobManager(
+    lookup_tool,
+    os.path.join(lookup_tool.results_dir, 'jobs'),
+    max_workers=WEB_SETTINGS['job_workers'],
+    max_pending=WEB_SETTINGS['job_max_pending'],
+    max_history=WEB_SETTINGS['job_history']
+)
+
 # HTML Templates
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -355,6 +385,9 @@ HTML_TEMPLATE = """
                             <label for="phoneNumber">📞 Phone Number (with country code):</label>
                             <input type="text" id="phoneNumber" name="phoneNumber" placeholder="+1234567890" required>
                         </div>
+                        <div class="input-group">
+                            <label><input type="checkbox" id="fastSingle" style="width: auto;"> ⚡ Fast mode (real metadata only, no simulation)</label>
+                        </div>
                         <button type="submit" class="btn">🔍 Analyze Number</button>
                     </form>
                 </div>
@@ -369,6 +402,9 @@ HTML_TEMPLATE = """
                             <label for="phoneNumbers">📞 Phone Numbers (one per line):</label>
                             <textarea id="phoneNumbers" name="phoneNumbers" rows="10" placeholder="+1234567890\n+0987654321\n+1122334455" required></textarea>
                         </div>
+                        <div class="input-group">
+                            <label><input type="checkbox" id="fastBatch" style="width: auto;"> ⚡ Fast mode (real metadata only, no simulation)</label>
+                        </div>
                         <button type="submit" class="btn">🔍 Analyze Numbers</button>
                     </form>
                 </div>
@@ -541,7 +577,10 @@ HTML_TEMPLATE = """
                     headers: {
                         'Content-Type': 'application/json',
                     },
-                    body: JSON.stringify({ phone_number: phoneNumber })
+                    body: JSON.stringify({
+                        phone_number: phoneNumber,
+                        engine: document.getElementById('fastSingle').checked ? 'fast' : null
+                    })
                 });
                 
                 const data = await response.json();
@@ -580,7 +619,10 @@ HTML_TEMPLATE = """
                     headers: {
                         'Content-Type': 'application/json',
                     },
-                    body: JSON.stringify({ phone_numbers: phoneNumbers })
+                    body: JSON.stringify({
+                        phone_numbers: phoneNumbers,
+                        engine: document.getElementById('fastBatch').checked ? 'fast' : null
+                    })
                 });
                 
                 const data = await response.json();
@@ -639,14 +681,92 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Request metrics (exported on /metrics, one set per server process)
+HTTP_REQUESTS = REGISTRY.counter(
+    'phone_lookup_http_requests_total', 'HTTP requests by route, method and status', ('route', 'method', 'status')
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    'phone_lookup_http_request_duration_seconds', 'HTTP request latency by route, including streamed bodies',
+    ('route',), buckets=REQUEST_BUCKETS
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge('phone_lookup_http_requests_in_flight', 'HTTP requests currently being served')
+BATCH_SIZES = REGISTRY.histogram(
+    'phone_lookup_batch_size', 'Phone numbers per batch request', ('route',), buckets=SIZE_BUCKETS
+)
+NUMBERS_ANALYZED = REGISTRY.counter(
+    'phone_lookup_numbers_analyzed_total', 'Phone numbers analyzed by web requests (rate() gives throughput)',
+    ('engine',)
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    'phone_lookup_cache_lookups_total', 'Result cache lookups by cache and outcome', ('cache', 'result')
+)
+CACHE_HIT_RATIO = REGISTRY.gauge('phone_lookup_cache_hit_ratio', 'Result cache hit ratio since start', ('cache',))
+
+def _collect_cache_metrics():
+    """Mirror the result cache counters into the registry at scrape time"""
+    stats = lookup_tool.cache_stats()
+    caches = []
+    if stats['enabled']:
+        caches.append(('memory', stats))
+    if 'sqlite' in stats:
+        caches.append(('sqlite', stats['sqlite']))
+    if 'metadata' in stats:
+        caches.append(('metadata', stats['metadata']))
+    for name, cache in caches:
+        CACHE_LOOKUPS.labels(name, 'hit').set(cache['hits'])
+        CACHE_LOOKUPS.labels(name, 'miss').set(cache['misses'])
+        CACHE_HIT_RATIO.labels(name).set(cache['hit_ratio'])
+
+REGISTRY.add_collector(_collect_cache_metrics)
+
+@app.before_request
+def _start_request_metrics():
+    g.request_start = time.perf_counter()
+    HTTP_IN_FLIGHT.labels().inc()
+
+@app.after_request
+def _record_request_metrics(response):
+    start = g.pop('request_start', None)
+    if start is None:
+        return response
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    labels = (route, request.method, str(response.status_code))
+    
+    # Recorded when the server closes the response, so streamed batches are timed in full
+    def finish():
+        HTTP_IN_FLIGHT.labels().dec()
+        HTTP_REQUESTS.labels(*labels).inc()
+        HTTP_LATENCY.labels(route).observe(time.perf_counter() - start)
+    
+    response.call_on_close(finish)
+    return response
+
 @app.route('/')
 def index():
     """Main page"""
     return render_template_string(HTML_TEMPLATE,
                                 developer_name=DEVELOPER_INFO['name'],
                                 developer_email=DEVELOPER_INFO['email'],
-                                app_name=APP_SETTINGS['name'],
-                                app_version=APP_SETTINGS['version'])
+                                app_name=APP_SETTINGS['app_name'],
+                                app_version=DEVELOPER_INFO['version'])
+
+def _result_to_dict(result) -> Dict:
+    """Convert a PhoneAnalysisResult to the JSON shape returned by the API"""
+    return {
+        'phone_number': result.phone_number,
+        'formatted_number': result.formatted_number,
+        'country_code': result.country_code,
+        'country_name': result.country_name,
+        'region': result.region,
+        'carrier': result.carrier,
+        'line_type': result.line_type,
+        'timezone': result.timezone,
+        'is_valid': result.is_valid,
+        'is_possible': result.is_possible,
+        'analysis_timestamp': result.analysis_timestamp,
+        'confidence_score': result.confidence_score,
+        'educational_note': result.educational_note
+    }
 
 @app.route('/analyze', methods=['POST'])
 def analyze_single():
@@ -654,6 +774,7 @@ def analyze_single():
     try:
         data = request.get_json()
         phone_number = data.get('phone_number', '').strip()
+        engine = data.get('engine') or lookup_tool.engine
         
         if not phone_number:
             return jsonify({
@@ -661,28 +782,21 @@ def analyze_single():
                 'error': 'Phone number is required'
             })
         
+        if engine not in ANALYSIS_ENGINES:
+            return jsonify({
+                'success': False,
+                'error': f'Unknown analysis engine: {engine}'
+            })
+        
         # Perform analysis
-        result = lookup_tool.comprehensive_analysis(phone_number)
+        result = lookup_tool.comprehensive_analysis(phone_number, engine)
+        NUMBERS_ANALYZED.labels(engine).inc()
         
         # Convert result to dict
-        result_dict = {
-            'phone_number': result.phone_number,
-            'formatted_number': result.formatted_number,
-            'country_code': result.country_code,
-            'country_name': result.country_name,
-            'region': result.region,
-            'carrier': result.carrier,
-            'line_type': result.line_type,
-            'timezone': result.timezone,
-            'is_valid': result.is_valid,
-            'is_possible': result.is_possible,
-            'analysis_timestamp': result.analysis_timestamp,
-            'confidence_score': result.confidence_score,
-            'educational_note': result.educational_note
-        }
-        
-        # Save result
-        lookup_tool.save_results([result])
+        result_dict = _result_to_dict(result)
+        
+        # Queue result for persistence (written by the background flusher)
+        result_writer.submit(result)
         
         return jsonify({
             'success': True,
@@ -701,6 +815,7 @@ def analyze_batch():
     try:
         data = request.get_json()
         phone_numbers = data.get('phone_numbers', [])
+        engine = data.get('engine') or lookup_tool.engine
         
         if not phone_numbers:
             return jsonify({
@@ -708,37 +823,42 @@ def analyze_batch():
                 'error': 'Phone numbers are required'
             })
         
-        if len(phone_numbers) > 50:  # Limit batch size
+        if engine not in ANALYSIS_ENGINES:
             return jsonify({
                 'success': False,
-                'error': 'Maximum 50 phone numbers allowed per batch'
+                'error': f'Unknown analysis engine: {engine}'
             })
         
-        # Perform batch analysis
-        results = lookup_tool.batch_analysis(phone_numbers)
+        BATCH_SIZES.labels('/batch_analyze').observe(len(phone_numbers))
+        
+        # Streaming mode: ?stream=true, {"stream": true} or Accept: application/x-ndjson
+        stream = (request.args.get('stream', '').lower() in ('1', 'true', 'yes')
+                  or bool(data.get('stream'))
+                  or request.accept_mimetypes.best == 'application/x-ndjson')
+        if stream:
+            if len(phone_numbers) > WEB_SETTINGS['bulk_max_numbers']:
+                return jsonify({
+                    'success': False,
+                    'error': f"Maximum {WEB_SETTINGS['bulk_max_numbers']} phone numbers allowed per streamed batch"
+                })
+            # Saving each streamed batch to its own file is opt-in, as for /api/bulk_analyze
+            save = request.args.get('save', data.get('save', WEB_SETTINGS['bulk_save_results']))
+            save = str(save).lower() in ('1', 'true', 'yes')
+            return Response(stream_with_context(_stream_batch(phone_numbers, engine, save)),
+                            mimetype='application/x-ndjson')
         
-        # Convert results to dict format
-        results_dict = []
-        for result in results:
-            result_dict = {
-                'phone_number': result.phone_number,
-                'formatted_number': result.formatted_number,
-                'country_code': result.country_code,
-                'country_name': result.country_name,
-                'region': result.region,
-                'carrier': result.carrier,
-                'line_type': result.line_type,
-                'timezone': result.timezone,
-                'is_valid': result.is_valid,
-                'is_possible': result.is_possible,
-                'analysis_timestamp': result.analysis_timestamp,
-                'confidence_score': result.confidence_score,
-                'educational_note': result.educational_note
-            }
-            results_dict.append(result_dict)
+        if len(phone_numbers) > WEB_SETTINGS['batch_max_numbers']:  # Limit batch size
+            return jsonify({
+                'success': False,
+                'error': f"Maximum {WEB_SETTINGS['batch_max_numbers']} phone numbers allowed per batch (use /api/bulk_analyze for more)"
+            })
+        
+        # Perform batch analysis and save (JSON Lines records are written as they complete)
+        results, _ = lookup_tool.batch_analysis_and_save(phone_numbers, engine)
+        NUMBERS_ANALYZED.labels(engine).inc(len(results))
         
-        # Save results
-        lookup_tool.save_results(results)
+        # Convert results to dict format
+        results_dict = [_result_to_dict(result) for result in results]
         
         return jsonify({
             'success': True,
@@ -751,37 +871,278 @@ def analyze_batch():
             'error': f'Batch analysis failed: {str(e)}'
         })
 
+def _read_bulk_numbers() -> List[str]:
+    """Read numbers from a JSON array/object or a newline-delimited text body"""
+    if request.is_json:
+        data = request.get_json(silent=True)
+        if data is None:
+            raise ValueError('Invalid JSON body')
+        if isinstance(data, dict):
+            data = data.get('phone_numbers', [])
+        if not isinstance(data, list):
+            raise ValueError('JSON body must be an array or {"phone_numbers": [...]}')
+        return [str(number).strip() for number in data if str(number).strip()]
+    
+    body = request.get_data(as_text=True)
+    return [line.strip() for line in body.splitlines() if line.strip()]
+
+@app.route('/api/bulk_analyze', methods=['POST'])
+def bulk_analyze():
+    """Analyze thousands of numbers per request with the columnar batch engine
+    
+    Body: JSON array, {"phone_numbers": [...]} or one number per line.
+    Query: format=records|columns (default records), save=true|false.
+    """
+    try:
+        phone_numbers = _read_bulk_numbers()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    if not phone_numbers:
+        return jsonify({'success': False, 'error': 'Phone numbers are required'}), 400
+    
+    if len(phone_numbers) > WEB_SETTINGS['bulk_max_numbers']:
+        return jsonify({
+            'success': False,
+            'error': f"Maximum {WEB_SETTINGS['bulk_max_numbers']} phone numbers allowed per bulk request"
+        }), 413
+    
+    BATCH_SIZES.labels('/api/bulk_analyze').observe(len(phone_numbers))
+    
+    output_format = request.args.get('format', 'records')
+    if output_format not in ('records', 'columns'):
+        return jsonify({'success': False, 'error': 'format must be records or columns'}), 400
+    
+    save = request.args.get('save', str(WEB_SETTINGS['bulk_save_results'])).lower() in ('1', 'true', 'yes')
+    
+    try:
+        from batch_engine import COLUMNS, BatchAnalysisEngine
+        
+        columns = BatchAnalysisEngine(workers=lookup_tool.workers,
+                                      stage_timings=lookup_tool.stage_timings).analyze(phone_numbers)
+        NUMBERS_ANALYZED.labels('columnar').inc(len(phone_numbers))
+        
+        response = {
+            'success': True,
+            'count': len(phone_numbers),
+            'educational_note': DISCLAIMERS['educational_use']
+        }
+        
+        if output_format == 'columns':
+            response['columns'] = {name: list(columns[name]) for name in COLUMNS}
+            response['columns']['is_valid'] = [bool(v) for v in columns['is_valid']]
+        else:
+            response['results'] = []
+            for row in zip(*(columns[name] for name in COLUMNS)):
+                record = dict(zip(COLUMNS, row))
+                record['is_valid'] = bool(record['is_valid'])
+                record['timezones'] = list(record['timezones'])
+                response['results'].append(record)
+        
+        if save:
+            from stream_pipeline import JSONLinesWriter, column_countries
+            
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            filepath = os.path.join(lookup_tool.results_dir, f"bulk_analysis_{timestamp}.jsonl")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                JSONLinesWriter(f).write_chunk(columns)
+            lookup_tool.index_result_file(filepath, len(phone_numbers), column_countries(columns))
+            response['saved_to'] = os.path.basename(filepath)
+        
+        return jsonify(response)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Bulk analysis failed: {str(e)}'
+        }), 500
+
+def _stream_batch(phone_numbers: List[str], engine: str, save: bool = False):
+    """Yield one NDJSON line per result as soon as it is ready
+    
+    Every line carries the input index, since simulation results can finish
+    out of order. Only a bounded window of analyses is in flight, so memory
+    stays flat. With save, the lines are also written to
+    results/batch_stream_<timestamp>.jsonl.
+    """
+    log_file = None
+    written = 0
+    countries = set()
+    if save:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filepath = os.path.join(lookup_tool.results_dir, f"batch_stream_{timestamp}.jsonl")
+        log_file = open(filepath, 'w', encoding='utf-8')
+    
+    def emit(index: int, result) -> str:
+        nonlocal written
+        line = json.dumps({'index': index, **_result_to_dict(result)}, ensure_ascii=False) + '\n'
+        if log_file is not None:
+            log_file.write(line)
+            written += 1
+            countries.add(result.country_code)
+        return line
+    
+    try:
+        if engine == 'fast':
+            # CPU-bound and fast: analyze inline, in input order
+            for index, number in enumerate(phone_numbers):
+                try:
+                    yield emit(index, lookup_tool.comprehensive_analysis(number, engine))
+                except Exception as e:
+                    yield json.dumps({'index': index, 'error': f'Analysis failed: {str(e)}'}) + '\n'
+        else:
+            # Simulation sleeps, so overlap a bounded number of analyses on threads
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                numbers = iter(enumerate(phone_numbers))
+                in_flight = {}
+                for index, number in islice(numbers, 6):
+                    in_flight[executor.submit(lookup_tool.comprehensive_analysis, number, engine)] = index
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = in_flight.pop(future)
+                        try:
+                            yield emit(index, future.result())
+                        except Exception as e:
+                            yield json.dumps({'index': index, 'error': f'Analysis failed: {str(e)}'}) + '\n'
+                        for next_index, number in islice(numbers, 1):
+                            in_flight[executor.submit(lookup_tool.comprehensive_analysis, number, engine)] = next_index
+    finally:
+        if log_file is not None:
+            log_file.close()
+            # Also index partial files left by a client that disconnected
+            lookup_tool.index_result_file(filepath, written, countries)
+    
+    NUMBERS_ANALYZED.labels(engine).inc(len(phone_numbers))
+    lookup_tool.flush_caches()
+
+def _uploaded_numbers(upload):
+    """Yield numbers line by line from an uploaded text file without reading it all"""
+    for line in io.TextIOWrapper(upload.stream, encoding='utf-8'):
+        line = line.strip()
+        if line:
+            yield line
+
+JOB_MIMETYPES = {
+    'jsonl': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.stream'
+}
+
+JOB_ENDPOINTS = {'submit_job', 'list_jobs', 'job_status', 'cancel_job', 'job_result'}
+
+def jobs_enabled() -> bool:
+    """Job state lives in one process, so jobs need a single server process"""
+    return WEB_SETTINGS['server_workers'] <= 1
+
+@app.before_request
+def _check_jobs_enabled():
+    if request.endpoint in JOB_ENDPOINTS and not jobs_enabled():
+        return jsonify({
+            'success': False,
+            'error': 'Background jobs are disabled when the server runs several worker '
+                     'processes (each would track its own jobs); start it with --workers 1'
+        }), 503
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """Submit a background analysis job
+    
+    Body: multipart upload field "file" (one number per line), a JSON array,
+    {"phone_numbers": [...]} or one number per line.
+    Query/form: engine=simulation|fast, format=jsonl|csv|parquet|arrow.
+    """
+    engine = request.values.get('engine') or lookup_tool.engine
+    output_format = request.values.get('format', 'jsonl')
+    
+    if engine not in ANALYSIS_ENGINES:
+        return jsonify({'success': False, 'error': f'Unknown analysis engine: {engine}'}), 400
+    
+    try:
+        if 'file' in request.files:
+            numbers = _uploaded_numbers(request.files['file'])
+        else:
+            numbers = _read_bulk_numbers()
+        job = job_manager.submit(numbers, engine=engine, output_format=output_format)
+    except JobQueueFull as e:
+        return jsonify({'success': False, 'error': str(e)}), 429
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    return jsonify({
+        'success': True,
+        'job': job.to_dict(),
+        'status_url': url_for('job_status', job_id=job.job_id),
+        'result_url': url_for('job_result', job_id=job.job_id)
+    }), 202
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    """List known jobs, newest first"""
+    return jsonify({'success': True, 'jobs': job_manager.list()})
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Poll job status and progress"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a queued job, or a running job after its current chunk"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+@app.route('/jobs/<job_id>/result')
+def job_result(job_id):
+    """Download the result file of a completed job"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    if job.status != COMPLETED:
+        return jsonify({'success': False, 'error': f'Job is {job.status}', 'job': job.to_dict()}), 409
+    
+    mimetype = JOB_MIMETYPES.get(job.output_format, 'application/octet-stream')
+    return send_file(os.path.abspath(job.output_path), mimetype=mimetype, as_attachment=True,
+                     download_name=f"analysis_{job.job_id}.{job.output_format}")
+
 @app.route('/history')
 def get_history():
-    """Get analysis history"""
+    """Get analysis history
+    
+    Query: limit (default 20, max 200), offset, since/until (Unix
+    timestamps), country (e.g. +966), q (file name substring).
+    """
     try:
-        results_dir = lookup_tool.results_dir
-        
-        if not os.path.exists(results_dir):
-            return jsonify({
-                'success': True,
-                'files': []
-            })
+        limit = max(1, min(request.args.get('limit', 20, type=int), 200))
+        offset = max(0, request.args.get('offset', 0, type=int))
+        
+        page = lookup_tool.history.query(
+            limit=limit,
+            offset=offset,
+            since=request.args.get('since', type=float),
+            until=request.args.get('until', type=float),
+            country=request.args.get('country'),
+            name=request.args.get('q')
+        )
         
         files = []
-        for filename in os.listdir(results_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(results_dir, filename)
-                mtime = os.path.getmtime(filepath)
-                mtime_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-                
-                files.append({
-                    'name': filename,
-                    'modified': mtime_str,
-                    'timestamp': mtime
-                })
-        
-        # Sort by modification time (newest first)
-        files.sort(key=lambda x: x['timestamp'], reverse=True)
+        for entry in page['entries']:
+            entry['modified'] = datetime.fromtimestamp(entry['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+            files.append(entry)
         
         return jsonify({
             'success': True,
-            'files': files[:20]  # Return last 20 files
+            'files': files,
+            'total': page['total'],
+            'limit': limit,
+            'offset': offset
         })
         
     except Exception as e:
@@ -797,7 +1158,7 @@ def download_file(filename):
         results_dir = lookup_tool.results_dir
         filepath = os.path.join(results_dir, filename)
         
-        if not os.path.exists(filepath) or not filename.endswith('.json'):
+        if not os.path.exists(filepath) or not filename.endswith(('.json', '.jsonl')):
             return jsonify({
                 'success': False,
                 'error': 'File not found'
@@ -811,26 +1172,94 @@ def download_file(filename):
             'error': f'Download failed: {str(e)}'
         }), 500
 
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics: requests, latency, batch sizes, caches, throughput
+    
+    Stage timing histograms are included when stage timing is on.
+    """
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/info')
 def api_info():
     """API information endpoint"""
     return jsonify({
-        'app_name': APP_SETTINGS['name'],
-        'version': APP_SETTINGS['version'],
+        'app_name': APP_SETTINGS['app_name'],
+        'version': DEVELOPER_INFO['version'],
         'developer': DEVELOPER_INFO,
-        'educational_note': DISCLAIMERS['educational_purpose'],
+        'educational_note': DISCLAIMERS['educational_use'],
+        'engine': lookup_tool.engine,
+        'available_engines': list(ANALYSIS_ENGINES),
+        'cache': lookup_tool.cache_stats(),
+        'persistence': result_writer.stats(),
+        'stage_timing': lookup_tool.stage_timings.enabled,
+        'jobs_enabled': jobs_enabled(),
         'endpoints': {
             '/': 'Web interface',
             '/analyze': 'POST - Analyze single phone number',
-            '/batch_analyze': 'POST - Analyze multiple phone numbers',
-            '/history': 'GET - Get analysis history',
+            '/batch_analyze': 'POST - Analyze multiple phone numbers (?stream=true for NDJSON, &save=true to keep a copy)',
+            '/jobs': 'POST - Submit background job (file upload or number list); GET - List jobs',
+            '/jobs/<job_id>': 'GET - Job status and progress; DELETE - Cancel job',
+            '/jobs/<job_id>/result': 'GET - Download completed job results',
+            '/api/bulk_analyze': 'POST - Bulk analysis (JSON array or newline-delimited body, fast engine)',
+            '/history': 'GET - Paginated analysis history (limit, offset, since, until, country, q)',
             '/download/<filename>': 'GET - Download analysis file',
+            '/metrics': 'GET - Prometheus metrics',
             '/api/info': 'GET - API information'
         }
     })
 
-def run_server(host='127.0.0.1', port=5000, debug=False):
+def create_asgi_app(threads: Optional[int] = None):
+    """Wrap the Flask app for an ASGI server
+    
+    Each request runs on a pool of `threads` worker threads, so slow
+    analyses never block the event loop that accepts connections.
+    """
+    from a2wsgi import WSGIMiddleware
+    
+    return WSGIMiddleware(app, workers=threads or WEB_SETTINGS['server_threads'])
+
+def run_asgi_server(host: str, port: int, workers: int, threads: int, keep_alive: int,
+                    max_concurrency: int):
+    """Serve the app with uvicorn (production mode)"""
+    import uvicorn
+    
+    WEB_SETTINGS['server_workers'] = workers
+    if workers > 1:
+        print("⚠️ Background jobs (/jobs) are disabled with more than one worker process\n")
+        # Worker processes import the app themselves; hand settings over via the environment
+        os.environ['PHONE_LOOKUP_SERVER_WORKERS'] = str(workers)
+        os.environ['PHONE_LOOKUP_ENGINE'] = lookup_tool.engine
+        os.environ['PHONE_LOOKUP_PERSISTENCE'] = result_writer.policy
+        os.environ['PHONE_LOOKUP_SERVER_THREADS'] = str(threads)
+        os.environ['PHONE_LOOKUP_STAGE_TIMING'] = str(lookup_tool.stage_timings.enabled).lower()
+        target, factory = 'web_interface:create_asgi_app', True
+    else:
+        target, factory = create_asgi_app(threads), False
+    
+    uvicorn.run(
+        target,
+        factory=factory,
+        host=host,
+        port=port,
+        workers=workers,
+        interface='asgi3',
+        lifespan='off',
+        timeout_keep_alive=keep_alive,
+        limit_concurrency=max_concurrency,
+        backlog=WEB_SETTINGS['backlog'],
+        access_log=False
+    )
+
+def run_server(host='127.0.0.1', port=5000, debug=False, server=None, workers=None, threads=None,
+               keep_alive=None, max_concurrency=None):
     """Run the web server"""
+    server = server or WEB_SETTINGS['server']
+    if server == 'asgi' and not ASGI_AVAILABLE:
+        print("❌ Error: ASGI server mode needs uvicorn and a2wsgi")
+        print("📦 Install with: pip install uvicorn a2wsgi")
+        return
+    
     print(f"\n🌐 Starting Phone Lookup Web Interface...")
     print(f"📱 Developer: {DEVELOPER_INFO['name']}")
     print(f"📧 Email: {DEVELOPER_INFO['email']}")
@@ -840,7 +1269,16 @@ def run_server(host='127.0.0.1', port=5000, debug=False):
     print(f"\n🛑 Press Ctrl+C to stop the server\n")
     
     try:
-        app.run(host=host, port=port, debug=debug, threaded=True)
+        if server == 'asgi':
+            run_asgi_server(
+                host, port,
+                workers=workers or WEB_SETTINGS['server_workers'],
+                threads=threads or WEB_SETTINGS['server_threads'],
+                keep_alive=keep_alive or WEB_SETTINGS['keep_alive'],
+                max_concurrency=max_concurrency or WEB_SETTINGS['max_concurrency']
+            )
+        else:
+            app.run(host=host, port=port, debug=debug, threaded=True)
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped by user")
     except Exception as e:
@@ -854,8 +1292,27 @@ def main():
     parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
     parser.add_argument('--port', type=int, default=5000, help='Port to bind to (default: 5000)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--engine', choices=ANALYSIS_ENGINES, default=lookup_tool.engine,
+                        help=f'Default analysis engine (default: {lookup_tool.engine})')
+    parser.add_argument('--persistence', choices=PERSISTENCE_POLICIES, default=result_writer.policy,
+                        help=f'How /analyze results are saved (default: {result_writer.policy})')
+    parser.add_argument('--server', choices=['development', 'asgi'], default=WEB_SETTINGS['server'],
+                        help=f"Server mode: Flask development server or uvicorn ASGI (default: {WEB_SETTINGS['server']})")
+    parser.add_argument('--workers', type=int, default=WEB_SETTINGS['server_workers'],
+                        help='ASGI server processes (more than one disables background jobs)')
+    parser.add_argument('--threads', type=int, default=WEB_SETTINGS['server_threads'],
+                        help='ASGI request handler threads per process')
+    parser.add_argument('--keep-alive', type=int, default=WEB_SETTINGS['keep_alive'],
+                        help='ASGI keep-alive timeout in seconds')
+    parser.add_argument('--max-concurrency', type=int, default=WEB_SETTINGS['max_concurrency'],
+                        help='ASGI connections/tasks per process before responding 503')
+    parser.add_argument('--stage-timing', action='store_true', default=lookup_tool.stage_timings.enabled,
+                        help='Record per-stage analysis timings (exported on /metrics)')
     
     args = parser.parse_args()
+    lookup_tool.engine = args.engine
+    lookup_tool.stage_timings.enabled = args.stage_timing
+    result_writer.policy = args.persistence
     
     # Security warning for public access
     if args.host != '127.0.0.1' and args.host != 'localhost':
@@ -868,7 +1325,9 @@ def main():
             print("👋 Cancelled by user")
             return
     
-    run_server(host=args.host, port=args.port, debug=args.debug)
+    run_server(host=args.host, port=args.port, debug=args.debug, server=args.server,
+               workers=args.workers, threads=args.threads, keep_alive=args.keep_alive,
+               max_concurrency=args.max_concurrency)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file